@@ -8,13 +8,19 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
 # Scraping Configuration
 SCRAPE_INTERVAL = 30 * 60  # 30 minutes in seconds
+MAX_SCRAPE_INTERVAL = 4 * SCRAPE_INTERVAL  # ceiling for sites that keep returning nothing new
+SCRAPE_BACKOFF_FACTOR = 1.5
+CIRCUIT_BREAKER_MAX_COOLDOWN = 6 * 60 * 60  # longest a repeatedly failing site is skipped
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 30
+DRY_RUN_TIMEOUT = 5  # seconds a website config dry run waits for its page
+FETCH_RETRY_BUDGET = 60  # seconds a page fetch may spend before giving up on retries
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
 # Data Storage
 DATABASE_PATH = 'data/exam_updates.db'
 JSON_BACKUP_PATH = 'data/backups/'
+VACUUM_FREE_RATIO = 0.15  # VACUUM only once this share of database pages is free
 
 # Logging
 LOG_LEVEL = 'INFO'
@@ -31,6 +37,9 @@ AI_RATE_LIMIT_DELAY = 1  # seconds between AI requests
 # Performance
 MAX_CONCURRENT_REQUESTS = 5
 CACHE_TTL = 300  # 5 minutes
+STATUS_CACHE_TTL = 30  # dashboard status is polled, so its cached queries expire quickly
+DEDUP_WINDOW = 24 * 60 * 60  # skip re-checking stored items for 24 hours
+DEDUP_MAX_HASHES = 50000
 
 # Notification (Disabled - focusing on data scraping only)
 ENABLE_NOTIFICATIONS = False
@@ -1,15 +1,17 @@
-import json
 import os
 import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Iterable, Optional, Tuple
 try:
     from .storage import DataStorage
     from ..utils.webhook_service import create_webhook_service
+    from ..utils.helpers import write_json_atomic, read_json
 except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from data.storage import DataStorage
     from utils.webhook_service import create_webhook_service
+    from utils.helpers import write_json_atomic, read_json
 
 
 class NotificationManager:
@@ -27,6 +29,13 @@ class NotificationManager:
         # Initialize notification queue (lazy import to avoid circular dependency)
         self.notification_queue = None
         
+        # Change tracking so streaming clients can wait instead of polling the file
+        self._change_condition = threading.Condition()
+        self._change_version = 0
+        
+        # Data file path -> ((mtime_ns, size), summary) so status checks only reparse changed files
+        self._summary_cache = {}
+        
         # Ensure directories exist
         os.makedirs(os.path.dirname(self.notification_file), exist_ok=True)
         os.makedirs(os.path.dirname(self.main_data_file), exist_ok=True)
@@ -56,8 +65,7 @@ class NotificationManager:
             }
         
         try:
-            with open(self.main_data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(self.main_data_file)
         except Exception as e:
             print(f"⚠️  Error reading existing data: {e}")
             return {
@@ -93,8 +101,7 @@ class NotificationManager:
             }
         
         try:
-            with open(self.notification_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(self.notification_file)
         except Exception as e:
             print(f"⚠️  Error reading notification data: {e}")
             return {
@@ -115,6 +122,39 @@ class NotificationManager:
             print("✅ Cleared updated_notifications.json")
         except Exception as e:
             print(f"❌ Error clearing notifications: {e}")
+        finally:
+            self._notify_change()
+    
+    def _notify_change(self) -> None:
+        """Wake up any clients waiting for notification data to change"""
+        with self._change_condition:
+            self._change_version += 1
+            self._change_condition.notify_all()
+    
+    def get_notification_file_version(self) -> Optional[Tuple[int, int]]:
+        """Get the notification file's (mtime_ns, size), or None if it does not exist"""
+        try:
+            stat = os.stat(self.notification_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def wait_for_change(self, last_version: int, timeout: float = None) -> int:
+        """
+        Block until notification data changes or the timeout expires
+        
+        Args:
+            last_version: Change version the caller has already seen
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            Current change version
+        """
+        with self._change_condition:
+            self._change_condition.wait_for(
+                lambda: self._change_version != last_version, timeout
+            )
+            return self._change_version
     
     def determine_category(self, update: Dict[str, Any]) -> str:
         """Determine the correct category for an update"""
@@ -162,12 +202,13 @@ class NotificationManager:
     def save_notifications(self, notification_data: Dict[str, Any]) -> None:
         """Save notification data to updated_notifications.json"""
         try:
-            with open(self.notification_file, 'w', encoding='utf-8') as f:
-                json.dump(notification_data, f, indent=2, ensure_ascii=False)
+            write_json_atomic(self.notification_file, notification_data)
             print(f"✅ Notifications saved to: {self.notification_file}")
         except Exception as e:
             print(f"❌ Error saving notifications: {e}")
             raise
+        finally:
+            self._notify_change()
     
     def send_webhook_notifications(self, notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -235,8 +276,7 @@ class NotificationManager:
         
         # Save new data
         try:
-            with open(self.main_data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_atomic(self.main_data_file, data)
             print(f"✅ Main data saved to: {self.main_data_file}")
         except Exception as e:
             print(f"❌ Error saving main data: {e}")
@@ -294,12 +334,15 @@ class NotificationManager:
         except Exception as e:
             print(f"❌ Error during backup cleanup: {e}")
     
-    def process_new_scraped_data(self, new_updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_new_scraped_data(self, new_updates: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process new scraped data and compare with existing data
         Returns the updated main data and new notifications
+        
+        Args:
+            new_updates: Any iterable of updates; it is consumed in a single pass
         """
-        print(f"🔄 Processing {len(new_updates)} new scraped updates...")
+        print("🔄 Processing new scraped updates...")
         
         # Get existing data
         existing_data = self.get_existing_data()
@@ -317,11 +360,22 @@ class NotificationManager:
         }
         
         # Track statistics
+        processed_count = 0
         new_items_count = 0
         updated_items_count = 0
         
+        # Index existing items by hash so updates don't rescan whole categories
+        existing_positions = {
+            category: {
+                item.get('content_hash'): i
+                for i, item in enumerate(existing_data.get(category, []))
+            }
+            for category in ["jee", "gate", "jee_adv", "upsc"]
+        }
+        
         # Process new updates
         for update in new_updates:
+            processed_count += 1
             content_hash = update.get('content_hash', '')
             
             if not content_hash:
@@ -333,6 +387,7 @@ class NotificationManager:
                 formatted_update = self.format_update(update)
                 
                 # Add to main data
+                existing_positions[category][content_hash] = len(existing_data[category])
                 existing_data[category].append(formatted_update)
                 
                 # Add to notifications (only new items)
@@ -346,11 +401,10 @@ class NotificationManager:
                 formatted_update = self.format_update(update)
                 
                 # Find and update existing item in main data
-                for i, existing_item in enumerate(existing_data[category]):
-                    if existing_item.get('content_hash') == content_hash:
-                        existing_data[category][i] = formatted_update
-                        updated_items_count += 1
-                        break
+                position = existing_positions[category].get(content_hash)
+                if position is not None:
+                    existing_data[category][position] = formatted_update
+                    updated_items_count += 1
         
         # Sort each category by scraped_at date (newest first)
         for category in ["jee", "gate", "jee_adv", "upsc"]:
@@ -376,6 +430,7 @@ class NotificationManager:
         )
         
         print(f"📊 Processing summary:")
+        print(f"   - Scraped updates processed: {processed_count}")
         print(f"   - New items added: {new_items_count}")
         print(f"   - Items updated: {updated_items_count}")
         print(f"   - New notifications: {notification_data['total_new_notifications']}")
@@ -444,7 +499,7 @@ class NotificationManager:
         
         return initial_data
     
-    def process_next_scrape_cycle(self, new_scraped_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_next_scrape_cycle(self, new_scraped_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Step 2-6: Process next scrape cycle with comparison logic
         """
@@ -499,32 +554,53 @@ class NotificationManager:
         except Exception as e:
             print(f"❌ Error adding notifications to webhook queue: {e}")
     
+    def _summarize_data_file(self, path: str, load, total_key: str) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        """
+        Summarize a data file's category counts, reparsing it only when it has changed
+        
+        Args:
+            path: Data file to summarize
+            load: Function returning the file's parsed data
+            total_key: Key holding the file's total count
+            
+        Returns:
+            Tuple of (per-category counts with the total, the file's last_updated/last_scrape values)
+        """
+        try:
+            stat = os.stat(path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+        
+        cached = self._summary_cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        data = load()
+        counts = {category: len(data.get(category, [])) for category in ["jee", "gate", "jee_adv", "upsc"]}
+        counts['total'] = data.get(total_key, 0)
+        summary = (counts, {'last_updated': data.get('last_updated'), 'last_scrape': data.get('last_scrape')})
+        self._summary_cache[path] = (version, summary)
+        return summary
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current status of the notification system"""
-        main_data = self.get_existing_data()
-        notification_data = self.get_notification_data()
+        main_summary, main_times = self._summarize_data_file(
+            self.main_data_file, self.get_existing_data, 'total_notification'
+        )
+        notification_summary, _ = self._summarize_data_file(
+            self.notification_file, self.get_notification_data, 'total_new_notifications'
+        )
         queue_status = self._get_notification_queue().get_queue_status()
         
         return {
             'main_file_exists': os.path.exists(self.main_data_file),
             'notification_file_exists': os.path.exists(self.notification_file),
-            'main_data_summary': {
-                'jee': len(main_data.get('jee', [])),
-                'gate': len(main_data.get('gate', [])),
-                'jee_adv': len(main_data.get('jee_adv', [])),
-                'upsc': len(main_data.get('upsc', [])),
-                'total': main_data.get('total_notification', 0)
-            },
-            'notification_summary': {
-                'jee': len(notification_data.get('jee', [])),
-                'gate': len(notification_data.get('gate', [])),
-                'jee_adv': len(notification_data.get('jee_adv', [])),
-                'upsc': len(notification_data.get('upsc', [])),
-                'total': notification_data.get('total_new_notifications', 0)
-            },
+            'main_data_summary': main_summary,
+            'notification_summary': notification_summary,
             'queue_status': queue_status,
-            'last_updated': main_data.get('last_updated'),
-            'last_scrape': main_data.get('last_scrape')
+            'last_updated': main_times['last_updated'],
+            'last_scrape': main_times['last_scrape']
         }
     
     def get_queue_status(self) -> Dict[str, Any]:
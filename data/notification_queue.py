@@ -1,4 +1,3 @@
-import json
 import os
 import threading
 import time
@@ -12,11 +11,13 @@ from enum import Enum
 try:
     from .notification_manager import NotificationManager
     from ..utils.webhook_service import create_webhook_service
+    from ..utils.helpers import write_json_atomic, read_json
 except ImportError:
     import sys
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from data.notification_manager import NotificationManager
     from utils.webhook_service import create_webhook_service
+    from utils.helpers import write_json_atomic, read_json
 
 
 class NotificationStatus(Enum):
@@ -89,8 +90,7 @@ class NotificationQueueManager:
         """Load existing queue from file"""
         try:
             if os.path.exists(self.queue_file):
-                with open(self.queue_file, 'r', encoding='utf-8') as f:
-                    queue_data = json.load(f)
+                queue_data = read_json(self.queue_file)
                 
                 # Load queued notifications
                 for item_data in queue_data.get('queue', []):
@@ -143,8 +143,8 @@ class NotificationQueueManager:
                 'metrics': self.metrics
             }
             
-            with open(self.queue_file, 'w', encoding='utf-8') as f:
-                json.dump(queue_data, f, indent=2, ensure_ascii=False)
+            # Atomic so get_queue_status never reads a half-written file
+            write_json_atomic(self.queue_file, queue_data)
                 
         except Exception as e:
             self.logger.error(f"Error saving queue: {e}")
@@ -293,8 +293,7 @@ class NotificationQueueManager:
             
             # This is a bit tricky with Queue, we'll estimate based on file
             if os.path.exists(self.queue_file):
-                with open(self.queue_file, 'r', encoding='utf-8') as f:
-                    queue_data = json.load(f)
+                queue_data = read_json(self.queue_file)
                 
                 for item_data in queue_data.get('queue', []):
                     status = item_data.get('status', 'pending')
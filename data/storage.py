@@ -2,23 +2,88 @@ import sqlite3
 import json
 import os
 import shutil
+import threading
 import time
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from config.settings import DATABASE_PATH, JSON_BACKUP_PATH
+from config.settings import DATABASE_PATH, JSON_BACKUP_PATH, VACUUM_FREE_RATIO
 
 
 class DataStorage:
     def __init__(self, db_path=DATABASE_PATH):
         self.db_path = db_path
         self.logger = logging.getLogger(self.__class__.__name__)
+        # One connection per thread, reopened when the database file is recreated
+        self._local = threading.local()
+        self._generation = 0
         self.init_database()
 
+    def connection(self):
+        """Get this thread's SQLite connection, opened once and kept for the thread's lifetime"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(self.db_path)
+            # WAL mode is stored in the database file by init_database; synchronous is per connection
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=268435456')
+            # Bound the sampling done by PRAGMA optimize so it stays cheap
+            conn.execute('PRAGMA analysis_limit=1000')
+            self._local.conn = conn
+            self._local.generation = self._generation
+        elif conn.in_transaction and not getattr(self._local, 'bulk', False):
+            # A previous call failed before committing; don't let its writes leak into this one
+            conn.rollback()
+        return conn
+
+    def close_connections(self):
+        """Make every thread reopen its connection on next use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                # Refresh any statistics this connection's queries found stale
+                conn.execute('PRAGMA optimize')
+            except sqlite3.Error:
+                pass
+            conn.close()
+            self._local.conn = None
+        self._generation += 1
+
+    @contextmanager
+    def bulk_commit(self):
+        """Defer this thread's save and log commits into one transaction committed on exit"""
+        conn = self.connection()
+        self._local.bulk = True
+        # Updates saved in the transaction; backed up only once the commit has succeeded
+        self._local.bulk_saved = []
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.bulk = False
+            saved, self._local.bulk_saved = self._local.bulk_saved, []
+        
+        if saved:
+            self.save_json_backup(saved)
+
+    def _commit(self, conn):
+        """Commit now unless a surrounding bulk_commit() will"""
+        if not getattr(self._local, 'bulk', False):
+            conn.commit()
+
     def init_database(self):
         """Initialize SQLite database"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
+        # WAL persists in the database file, so every later connection opens in WAL mode
+        conn.execute('PRAGMA journal_mode=WAL')
         cursor = conn.cursor()
         
         # Check if we need to migrate from old schema
@@ -74,7 +139,6 @@ class DataStorage:
         ''')
         
         conn.commit()
-        conn.close()
         self.logger.info("Database initialized successfully")
 
     def _migrate_database_if_needed(self, cursor):
@@ -136,23 +200,20 @@ class DataStorage:
 
     def save_updates(self, updates):
         """Save updates to database with duplicate detection"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         new_updates = []
         
         for update in updates:
             try:
-                # Check if update already exists
-                cursor.execute('SELECT id FROM updates WHERE content_hash = ?', (update['content_hash'],))
-                if cursor.fetchone():
-                    continue  # Skip duplicate
-                
+                # content_hash is UNIQUE, so duplicates are skipped by the insert itself
                 cursor.execute('''
                     INSERT INTO updates 
                     (title, content_summary, source, exam_type, url, date, scraped_at, 
                      content_hash, priority)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(content_hash) DO NOTHING
                 ''', (
                     update['title'],
                     update.get('content_summary', ''),
@@ -171,11 +232,12 @@ class DataStorage:
             except sqlite3.Error as e:
                 self.logger.error(f"Database error saving update: {e}")
                 
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         
-        # Save JSON backup
-        if new_updates:
+        # Save JSON backup, deferred to the end of a surrounding bulk_commit() so rolled back rows are never listed
+        if getattr(self._local, 'bulk', False):
+            self._local.bulk_saved.extend(new_updates)
+        elif new_updates:
             self.save_json_backup(new_updates)
             
         return new_updates
@@ -209,7 +271,7 @@ class DataStorage:
 
     def get_recent_updates(self, hours=24, limit=100):
         """Get recent updates from database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -222,12 +284,11 @@ class DataStorage:
         columns = [desc[0] for desc in cursor.description]
         updates = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return updates
 
     def get_updates_by_source(self, source, limit=50):
         """Get updates from specific source"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -240,12 +301,11 @@ class DataStorage:
         columns = [desc[0] for desc in cursor.description]
         updates = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return updates
 
     def get_updates_by_exam_type(self, exam_type, limit=50):
         """Get updates by exam type"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -258,12 +318,11 @@ class DataStorage:
         columns = [desc[0] for desc in cursor.description]
         updates = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return updates
 
     def get_all_exam_types(self):
         """Get all available exam types"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -274,24 +333,22 @@ class DataStorage:
         ''')
         
         exam_types = cursor.fetchall()
-        conn.close()
         
         return [{'exam_type': row[0], 'count': row[1]} for row in exam_types]
 
     def check_existing_hash(self, content_hash):
         """Check if content hash exists in database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('SELECT id FROM updates WHERE content_hash = ?', (content_hash,))
         exists = cursor.fetchone() is not None
         
-        conn.close()
         return exists
 
     def log_scraping_attempt(self, source, status, updates_found=0, error_message=None, duration=None):
         """Log scraping attempt for monitoring"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -300,12 +357,41 @@ class DataStorage:
             VALUES (?, ?, ?, ?, ?)
         ''', (source, status, updates_found, error_message, duration))
         
-        conn.commit()
-        conn.close()
+        self._commit(conn)
+
+    def log_scraping_attempts(self, attempts):
+        """Log (source, status, updates_found, error_message, duration) tuples in one transaction"""
+        if not attempts:
+            return
+        
+        conn = self.connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany('''
+            INSERT INTO scraping_log 
+            (source, status, updates_found, error_message, duration_seconds)
+            VALUES (?, ?, ?, ?, ?)
+        ''', attempts)
+        
+        self._commit(conn)
+
+    def get_scraping_log(self, hours=24):
+        """Get raw scraping attempts as (epoch_seconds, source, status, updates_found, duration) rows"""
+        conn = self.connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT CAST(strftime('%s', scraped_at) AS INTEGER), source, status, updates_found, duration_seconds
+            FROM scraping_log 
+            WHERE datetime(scraped_at) > datetime('now', '-{} hours')
+            ORDER BY scraped_at
+        '''.format(hours))
+        
+        return cursor.fetchall()
 
     def get_scraping_stats(self, hours=24):
         """Get scraping statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -321,7 +407,6 @@ class DataStorage:
         '''.format(hours))
         
         stats = cursor.fetchall()
-        conn.close()
         
         return [
             {
@@ -336,7 +421,7 @@ class DataStorage:
 
     def cleanup_old_data(self, days=30):
         """Clean up old data to prevent database bloat"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         # Delete old updates (keep only recent ones)
@@ -356,11 +441,26 @@ class DataStorage:
         deleted_logs = cursor.rowcount
         
         conn.commit()
-        conn.close()
         
         self.logger.info(f"Cleanup completed: {deleted_updates} old updates and {deleted_logs} old logs deleted")
         return deleted_updates, deleted_logs
 
+    def optimize_database(self, vacuum_threshold=VACUUM_FREE_RATIO):
+        """Refresh stale planner statistics, and VACUUM only when enough pages are free"""
+        conn = self.connection()
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        
+        vacuumed = page_count > 0 and freelist_count / page_count > vacuum_threshold
+        if vacuumed:
+            conn.execute('VACUUM')
+        
+        # Unlike a full ANALYZE, this only re-analyzes tables whose statistics are out of date
+        conn.execute('PRAGMA optimize')
+        
+        self.logger.info(f"Optimization completed: {freelist_count}/{page_count} free pages, vacuumed={vacuumed}")
+        return vacuumed
+
     def robust_save(self, updates):
         """Save with database corruption handling"""
         try:
@@ -378,7 +478,11 @@ class DataStorage:
             
             # Reinitialize database
             try:
+                self.close_connections()
                 os.remove(self.db_path)
+                for suffix in ('-wal', '-shm'):
+                    if os.path.exists(self.db_path + suffix):
+                        os.remove(self.db_path + suffix)
                 self.init_database()
                 self.logger.info("Database reinitialized")
                 
@@ -391,11 +495,10 @@ class DataStorage:
     def check_database_integrity(self):
         """Check SQLite database integrity"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self.connection()
             cursor = conn.cursor()
             cursor.execute("PRAGMA integrity_check")
             result = cursor.fetchone()[0]
-            conn.close()
             return result == "ok"
         except Exception as e:
             self.logger.error(f"Database integrity check failed: {e}")
@@ -403,7 +506,7 @@ class DataStorage:
 
     def get_database_stats(self):
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         
         # Get total updates count
@@ -434,7 +537,6 @@ class DataStorage:
         ''')
         recent_updates = cursor.fetchone()[0]
         
-        conn.close()
         
         return {
             'total_updates': total_updates,
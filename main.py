@@ -1,6 +1,4 @@
 import argparse
-import sys
-import threading
 import logging
 import json
 import time
@@ -9,16 +7,27 @@ from datetime import datetime
 from flask import Flask, jsonify, request, render_template
 from mcp_server.server import MCPExamScrapingServer
 from config.settings import WEB_HOST, WEB_PORT
+from utils.helpers import write_json_atomic
+
+# Heartbeat SSE frame; only the ISO timestamp varies between ticks
+HEARTBEAT_EVENT = 'data: {"type": "heartbeat", "timestamp": "%s"}\n\n'
+
+# Longest the notification stream waits before checking the file for writes made by other processes
+NOTIFICATION_POLL_INTERVAL = 5
 
 
 def create_web_interface(server_instance=None):
     """Create a modern web interface for monitoring"""
     app = Flask(__name__, template_folder='templates')
     logger = logging.getLogger(__name__)
-    
+
+    # The dashboard template takes no context, so render it once at startup
+    with app.app_context():
+        dashboard_html = render_template('dashboard.html').encode('utf-8')
+
     @app.route('/')
     def index():
-        return render_template('dashboard.html')
+        return app.response_class(dashboard_html, mimetype='text/html')
     
     @app.route('/demo')
     def demo():
@@ -35,12 +44,13 @@ def create_web_interface(server_instance=None):
         if request.method == 'GET':
             # Return current demo notifications
             try:
-                # Check if file exists and has content
-                if not os.path.exists('demo_notifications.json'):
+                # Check if file exists and has content with a single stat call
+                try:
+                    file_stat = os.stat('demo_notifications.json')
+                except FileNotFoundError:
                     return jsonify({'success': True, 'notifications': []})
-                
-                # Check file size
-                if os.path.getsize('demo_notifications.json') == 0:
+
+                if file_stat.st_size == 0:
                     return jsonify({'success': True, 'notifications': []})
                 
                 with open('demo_notifications.json', 'r', encoding='utf-8') as f:
@@ -81,23 +91,22 @@ def create_web_interface(server_instance=None):
                 if not isinstance(notifications, list):
                     return jsonify({'success': False, 'error': 'Notifications must be a list'}), 400
                 
-                # Create backup before saving
+                # Keep the previous file as the backup; a hard link is a metadata
+                # operation and the old data survives the atomic replace below
                 if os.path.exists('demo_notifications.json'):
                     try:
-                        import shutil
-                        shutil.copy2('demo_notifications.json', 'demo_notifications_backup.json')
+                        if os.path.exists('demo_notifications_backup.json'):
+                            os.remove('demo_notifications_backup.json')
+                        try:
+                            os.link('demo_notifications.json', 'demo_notifications_backup.json')
+                        except OSError:
+                            import shutil
+                            shutil.copy2('demo_notifications.json', 'demo_notifications_backup.json')
                     except Exception as backup_error:
                         logger.warning(f"Failed to create backup: {backup_error}")
-                
+
                 # Write to a temporary file first, then rename to prevent corruption
-                temp_file = 'demo_notifications_temp.json'
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(notifications, f, indent=2, ensure_ascii=False)
-                
-                # Atomic rename to prevent corruption
-                if os.path.exists('demo_notifications.json'):
-                    os.remove('demo_notifications.json')
-                os.rename(temp_file, 'demo_notifications.json')
+                write_json_atomic('demo_notifications.json', notifications)
                 
                 return jsonify({'success': True, 'message': 'Notifications saved'})
             except Exception as e:
@@ -381,7 +390,38 @@ def create_web_interface(server_instance=None):
                     'error': str(e)
                 }), 500
         return jsonify({'error': 'Server not running'})
-    
+
+    @app.route('/bulk')
+    def get_bulk():
+        """Return latest notifications, queue status and server status in one response"""
+        if server_instance:
+            sources = {
+                'latest': server_instance.notification_manager.get_notification_data,
+                'queue': server_instance.notification_manager.get_queue_status,
+                'status': server_instance.get_status
+            }
+            # Accept both ?keys=latest,queue and repeated ?keys=latest&keys=queue
+            keys = [key for value in request.args.getlist('keys') for key in value.split(',') if key]
+            keys = keys or list(sources)
+            unknown = [key for key in keys if key not in sources]
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unknown keys: {', '.join(unknown)}"
+                }), 400
+            try:
+                return jsonify({
+                    'success': True,
+                    'results': {key: sources[key]() for key in keys},
+                    'timestamp': datetime.now().isoformat()
+                })
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 500
+        return jsonify({'error': 'Server not running'})
+
     @app.route('/notifications/queue/clear', methods=['POST'])
     def clear_notification_queue():
         """Clear the notification queue"""
@@ -406,44 +446,59 @@ def create_web_interface(server_instance=None):
             return jsonify({'error': 'Server not running'}), 500
         
         def generate():
+            notification_manager = server_instance.notification_manager
             last_count = 0
+            last_version = 0
+            last_file_version = None
+            data_changed = True
             heartbeat_interval = 30  # seconds
             last_heartbeat = time.time()
             
             while True:
                 try:
+                    # Read the clock once per tick and reuse it for every message
                     current_time = time.time()
+                    timestamp = datetime.fromtimestamp(current_time).isoformat()
                     
-                    # Get current notification count
-                    notification_data = server_instance.notification_manager.get_notification_data()
-                    current_count = notification_data.get('total_new_notifications', 0)
-                    
-                    # If there are new notifications, send them
-                    if current_count > last_count:
-                        yield f"data: {json.dumps({
-                            'type': 'new_notifications',
-                            'count': current_count - last_count,
-                            'notifications': notification_data,
-                            'timestamp': datetime.now().isoformat()
-                        })}\n\n"
-                        last_count = current_count
+                    # Reread the notification data only after an in-process change or a write to the file
+                    file_version = notification_manager.get_notification_file_version()
+                    if data_changed or file_version != last_file_version:
+                        last_file_version = file_version
+                        notification_data = notification_manager.get_notification_data()
+                        current_count = notification_data.get('total_new_notifications', 0)
+                        
+                        # If there are new notifications, send them
+                        if current_count > last_count:
+                            payload = {
+                                'type': 'new_notifications',
+                                'count': current_count - last_count,
+                                'notifications': notification_data,
+                                'timestamp': timestamp
+                            }
+                            yield f"data: {json.dumps(payload)}\n\n"
+                            last_count = current_count
                     
                     # Send heartbeat every 30 seconds
                     if current_time - last_heartbeat >= heartbeat_interval:
-                        yield f"data: {json.dumps({
-                            'type': 'heartbeat',
-                            'timestamp': datetime.now().isoformat()
-                        })}\n\n"
+                        yield HEARTBEAT_EVENT % timestamp
                         last_heartbeat = current_time
                     
-                    time.sleep(5)  # Check every 5 seconds for responsiveness
+                    # Sleep until the notification data changes, the next heartbeat is due or the file
+                    # should be checked again
+                    time_to_heartbeat = heartbeat_interval - (current_time - last_heartbeat)
+                    version = notification_manager.wait_for_change(
+                        last_version, timeout=min(max(time_to_heartbeat, 0), NOTIFICATION_POLL_INTERVAL)
+                    )
+                    data_changed = version != last_version
+                    last_version = version
                     
                 except Exception as e:
-                    yield f"data: {json.dumps({
+                    payload = {
                         'type': 'error',
                         'error': str(e),
                         'timestamp': datetime.now().isoformat()
-                    })}\n\n"
+                    }
+                    yield f"data: {json.dumps(payload)}\n\n"
                     break
         
         return app.response_class(
@@ -471,6 +526,7 @@ def create_web_interface(server_instance=None):
             while True:
                 try:
                     current_time = time.time()
+                    timestamp = datetime.fromtimestamp(current_time).isoformat()
                     queue_status = server_instance.notification_manager.get_queue_status()
 
                     # Prepare minimal snapshot to detect changes
@@ -484,14 +540,14 @@ def create_web_interface(server_instance=None):
                         payload = {
                             'type': 'queue_status',
                             'queue_status': queue_status,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': timestamp
                         }
                         yield f"data: {json.dumps(payload)}\n\n"
                         last_snapshot = snapshot
 
                     # Heartbeat to keep connection alive
                     if current_time - last_heartbeat >= heartbeat_interval:
-                        yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.now().isoformat()})}\n\n"
+                        yield HEARTBEAT_EVENT % timestamp
                         last_heartbeat = current_time
 
                     time.sleep(1)
@@ -515,8 +571,10 @@ def create_web_interface(server_instance=None):
 
 def main():
     parser = argparse.ArgumentParser(description='Exam Update Scraping Server')
-    parser.add_argument('--mode', choices=['server', 'single-run', 'web'], 
+    parser.add_argument('--mode', choices=['server', 'single-run', 'web', 'test-website'], 
                        default='server', help='Run mode')
+    parser.add_argument('--website', type=str,
+                       help='Configured website to dry-run in test-website mode')
     parser.add_argument('--port', type=int, default=WEB_PORT, 
                        help='Web interface port')
     parser.add_argument('--host', type=str, default=WEB_HOST,
@@ -538,6 +596,17 @@ def main():
         result = server.scrape_all_websites()
         print(f"Single run completed. Found {result['new_updates_count']} new updates.")
         
+    elif args.mode == 'test-website':
+        # Dry-run one configured website's selectors without storing or notifying anything
+        server = MCPExamScrapingServer()
+        website_config = next(
+            (website for website in server.website_configs['websites'] if website['name'] == args.website), None
+        )
+        if website_config is None:
+            parser.error(f"Unknown website: {args.website}")
+        result = server.test_website_config(website_config)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        
     elif args.mode == 'web':
         # Start web interface only
         logger.info(f"Starting web interface on {args.host}:{args.port}")
@@ -551,10 +620,8 @@ def main():
         
         app = create_web_interface(server)
         
-        # Start server in background thread
-        server_thread = threading.Thread(target=server.start_scheduler)
-        server_thread.daemon = True
-        server_thread.start()
+        # Start the scheduler; scraping runs on its background thread
+        server.start_scheduler()
         
         # Start web interface
         logger.info(f"Starting web interface on {args.host}:{args.port}")
@@ -564,9 +631,11 @@ def main():
         try:
             app.run(host=args.host, port=args.port, debug=False)
         except KeyboardInterrupt:
+            pass
+        finally:
+            # The development server handles Ctrl+C itself and simply returns, so clean up here
             logger.info("Shutting down server...")
-            server.stop_scheduler()
-            sys.exit(0)
+            server.shutdown()
 
 
 if __name__ == '__main__':
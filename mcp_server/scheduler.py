@@ -2,15 +2,24 @@ import schedule
 import time
 import threading
 import logging
-from config.settings import SCRAPE_INTERVAL
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 
 class Scheduler:
-    def __init__(self, scraping_function):
-        self.scraping_function = scraping_function
+    # Tag on every job this scheduler registers, so stop() leaves other jobs in the registry alone
+    JOB_TAG = 'exam-scraper'
+
+    def __init__(self, server):
+        self.server = server
+        self.scraping_function = server.scrape_due_websites
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Monotonic time the next scrape is due, following the earliest site's adaptive interval
+        self._next_scrape = None
         self.is_running = False
         self.scheduler_thread = None
+        self.maintenance_pool = None
+        self._stop_event = threading.Event()
 
     def start(self):
         """Start the scheduler"""
@@ -19,70 +28,92 @@ class Scheduler:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         
-        # Schedule scraping every SCRAPE_INTERVAL minutes (configurable)
-        schedule.every(SCRAPE_INTERVAL // 60).minutes.do(self.run_scraping)
+        # Database maintenance runs on its own worker so it cannot stall scheduled scraping
+        self.maintenance_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='maintenance')
         
         # Schedule daily cleanup at 2 AM
-        schedule.every().day.at("02:00").do(self.daily_cleanup)
+        schedule.every().day.at("02:00").do(self._run_maintenance, self.daily_cleanup).tag(self.JOB_TAG)
         
         # Schedule weekly database optimization
-        schedule.every().week.do(self.weekly_optimization)
+        schedule.every().week.do(self._run_maintenance, self.weekly_optimization).tag(self.JOB_TAG)
         
-        # Start scheduler in background thread
+        # Start scheduler in background thread; scraping is not a fixed-interval job, the loop
+        # wakes whenever the next website is due
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
         self.logger.info("Scheduler started successfully")
-        
-        # Run initial scraping
-        self.run_scraping()
 
     def stop(self):
         """Stop the scheduler"""
         self.is_running = False
-        schedule.clear()
+        self._stop_event.set()
+        schedule.clear(self.JOB_TAG)
+        if self.maintenance_pool:
+            self.maintenance_pool.shutdown(wait=False, cancel_futures=True)
+            self.maintenance_pool = None
         self.logger.info("Scheduler stopped")
 
     def _run_scheduler(self):
         """Run the scheduler loop"""
+        # Run initial scraping on this thread so start() returns immediately
+        self.run_scraping()
+        
+        # Doubles on consecutive errors so a persistently failing job can't flood the log
+        error_backoff = 60
         while self.is_running:
             try:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                if time.monotonic() >= self._next_scrape:
+                    self.run_scraping()
+                error_backoff = 60
+                # Sleep until the next website or job is due; stop() wakes the loop immediately.
+                # The cap lets websites added in the meantime be picked up within a few minutes
+                timeout = self._next_scrape - time.monotonic()
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is not None:
+                    timeout = min(timeout, idle_seconds)
+                self._stop_event.wait(min(max(timeout, 0), 300))
             except Exception as e:
-                self.logger.error(f"Scheduler error: {e}")
-                time.sleep(60)
+                self.logger.error(f"Scheduler error: {e}, retrying in {error_backoff}s")
+                self._stop_event.wait(error_backoff)
+                error_backoff = min(error_backoff * 2, 3600)
 
     def run_scraping(self):
         """Run the scraping function"""
         try:
             self.logger.info("Starting scheduled scraping cycle...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             self.scraping_function()
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.info(f"Scheduled scraping completed in {duration:.2f} seconds")
             
         except Exception as e:
             self.logger.error(f"Scheduled scraping failed: {e}")
+        finally:
+            self._next_scrape = time.monotonic() + self.server.seconds_until_next_scrape()
+
+    def _run_maintenance(self, job):
+        """Submit a maintenance job to the maintenance worker"""
+        self.maintenance_pool.submit(job)
 
     def daily_cleanup(self):
         """Daily maintenance tasks"""
         try:
             self.logger.info("Running daily cleanup...")
             
-            # Import here to avoid circular imports
-            from data.storage import DataStorage
-            storage = DataStorage()
-            
-            # Clean up old data (keep last 30 days)
-            deleted_updates, deleted_logs = storage.cleanup_old_data(days=30)
-            
-            # Check database integrity
-            if not storage.check_database_integrity():
-                self.logger.warning("Database integrity check failed")
+            storage = self.server.storage
+            with self.server.maintenance():
+                # Clean up old data (keep last 30 days)
+                deleted_updates, deleted_logs = storage.cleanup_old_data(days=30)
+                
+                # Check database integrity
+                if not storage.check_database_integrity():
+                    self.logger.warning("Database integrity check failed")
             
             self.logger.info(f"Daily cleanup completed: {deleted_updates} updates and {deleted_logs} logs cleaned")
             
@@ -94,34 +125,44 @@ class Scheduler:
         try:
             self.logger.info("Running weekly optimization...")
             
-            from data.storage import DataStorage
-            storage = DataStorage()
-            
-            # Optimize database
-            conn = storage.db_path
-            import sqlite3
-            with sqlite3.connect(conn) as db:
-                db.execute("VACUUM")
-                db.execute("ANALYZE")
+            # Optimize database; VACUUM is skipped unless deletions left enough free space
+            with self.server.maintenance():
+                vacuumed = self.server.storage.optimize_database()
             
-            self.logger.info("Weekly optimization completed")
+            self.logger.info(f"Weekly optimization completed (vacuumed: {vacuumed})")
             
         except Exception as e:
             self.logger.error(f"Weekly optimization failed: {e}")
 
+    def _next_scrape_time(self):
+        """Wall-clock time of the next scrape, or None before the first one has run"""
+        if self._next_scrape is None:
+            return None
+        return datetime.now() + timedelta(seconds=max(self._next_scrape - time.monotonic(), 0))
+
     def get_next_run_time(self):
         """Get the next scheduled run time"""
-        next_run = schedule.next_run()
-        return next_run.isoformat() if next_run else None
+        next_runs = [job.next_run for job in schedule.get_jobs(self.JOB_TAG) if job.next_run]
+        next_scrape = self._next_scrape_time()
+        if next_scrape is not None:
+            next_runs.append(next_scrape)
+        return min(next_runs).isoformat() if next_runs else None
 
     def get_schedule_info(self):
         """Get information about the current schedule"""
-        jobs = schedule.get_jobs()
+        next_scrape = self._next_scrape_time()
+        jobs = schedule.get_jobs(self.JOB_TAG)
         return [
+            {
+                'job': 'scrape_due_websites',
+                'next_run': next_scrape.isoformat() if next_scrape else None,
+                'interval': 'adaptive per website'
+            }
+        ] + [
             {
                 'job': str(job.job_func),
                 'next_run': job.next_run.isoformat() if job.next_run else None,
-                'interval': str(job.interval) if hasattr(job, 'interval') else 'N/A'
+                'interval': str(job.interval)
             }
             for job in jobs
         ]
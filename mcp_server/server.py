@@ -1,166 +1,348 @@
-import json
+import atexit
 import logging
+import queue
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from scrapers import (
-    NTAScraper, JEEAdvancedScraper, 
-    GATEScraper, UPSCScraper, DemoScraper
-)
+from functools import cached_property
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
+import scrapers
 # AI processing removed - storing raw scraped data directly
 from data.storage import DataStorage
 from data.notification_manager import NotificationManager
+from config.settings import (
+    MAX_CONCURRENT_REQUESTS, STATUS_CACHE_TTL, DEDUP_WINDOW, DEDUP_MAX_HASHES,
+    SCRAPE_INTERVAL, MAX_SCRAPE_INTERVAL, SCRAPE_BACKOFF_FACTOR, CIRCUIT_BREAKER_MAX_COOLDOWN,
+    DRY_RUN_TIMEOUT
+)
+from utils.helpers import write_json_atomic, read_json
 from .scheduler import Scheduler
 
+WEBSITES_CONFIG_FILE = 'config/websites.json'
+
+
 class MCPExamScrapingServer:
+    # Names resolved lazily from the scrapers package when a website needs them
+    SCRAPER_CLASSES = frozenset({'NTAScraper', 'JEEAdvancedScraper', 'GATEScraper', 'UPSCScraper', 'DemoScraper'})
+
     def __init__(self):
         self.storage = DataStorage()
         self.notification_manager = NotificationManager(self.storage)
         # AI processor removed - storing raw data directly
         self.setup_logging()
+        # Nesting depth of config_transaction() and whether it has unsaved edits
+        self._config_batch_depth = 0
+        self._config_dirty = False
         self.load_website_configs()
         self.scrapers = {}
+        # content_hash -> last time it was confirmed in storage, oldest first; manual and scheduled
+        # cycles can run at the same time, so it is only touched under its lock
+        self._recent_hashes = OrderedDict()
+        self._recent_hashes_lock = threading.Lock()
+        # Status aggregate or query key -> (computed_at, value)
+        self._status_cache = {}
+        # Adaptive per-site scheduling: name -> current interval / monotonic due time
+        self._site_intervals = {}
+        self._next_due = {}
+        self._consecutive_failures = {}
+        # Worker threads are reused across cycles instead of being created for each one
+        self._scrape_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix='scrape')
+        # Rolling (timestamp, source, status, updates_found, duration) history for get_status,
+        # seeded from the scraping log on first use
+        self._scrape_history = None
+        self._scrape_history_lock = threading.Lock()
+        # One HTTP session and connection pool shared by every scraper
+        self._http_session = scrapers.BaseScraper.create_session()
+        # ISO timestamp of the most recent scraping cycle, reported by get_status
+        self._last_scrape = None
         self.init_scrapers()
-        self.scheduler = Scheduler(self.scrape_all_websites)
+        self.scheduler = Scheduler(self)
         self.logger.info("MCP Exam Scraping Server initialized")
 
+    @cached_property
+    def logger(self):
+        return logging.getLogger(__name__)
+
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('logs/scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        root_logger = logging.getLogger()
+        if any(isinstance(handler, QueueHandler) for handler in root_logger.handlers):
+            return
+        
+        # File and console output happen on a listener thread; logging calls only enqueue the record.
+        # Handlers an entry point already configured (main.py calls basicConfig) move behind the queue too
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = list(root_logger.handlers) or [logging.StreamHandler()]
+        if not any(isinstance(handler, logging.FileHandler) for handler in handlers):
+            handlers.append(logging.FileHandler('logs/scraper.log'))
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+            if handler.formatter is None:
+                handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        # Drain whatever is still queued when the process exits
+        atexit.register(listener.stop)
+        
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(QueueHandler(log_queue))
 
     def load_website_configs(self):
         """Load website configurations"""
         try:
-            with open('config/websites.json', 'r') as f:
-                self.website_configs = json.load(f)
+            self.website_configs = read_json(WEBSITES_CONFIG_FILE)
+            self._index_websites()
             self.logger.info(f"Loaded {len(self.website_configs['websites'])} website configurations")
         except Exception as e:
             self.logger.error(f"Failed to load website configurations: {e}")
             self.website_configs = {'websites': []}
+            self._index_websites()
+
+    def _index_websites(self):
+        """Index website configurations by name for O(1) lookups"""
+        self._websites_by_name = {w['name']: w for w in self.website_configs['websites']}
+
+    def save_website_configs(self):
+        """Write website configurations"""
+        # Inside config_transaction() the write is deferred to the end of the block
+        if self._config_batch_depth:
+            self._config_dirty = True
+            return
+        write_json_atomic(WEBSITES_CONFIG_FILE, self.website_configs)
+        self._config_dirty = False
+
+    @contextmanager
+    def config_transaction(self):
+        """Persist website configurations once for all edits made inside the block"""
+        self._config_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._config_batch_depth -= 1
+            if not self._config_batch_depth and self._config_dirty:
+                self.save_website_configs()
 
     def init_scrapers(self):
         """Initialize scraper instances"""
-        scraper_classes = {
-            'NTAScraper': NTAScraper,
-            'JEEAdvancedScraper': JEEAdvancedScraper,
-            'GATEScraper': GATEScraper,
-            'UPSCScraper': UPSCScraper,
-            'DemoScraper': DemoScraper
-        }
-        
         for website in self.website_configs['websites']:
             if not website.get('enabled', True):
                 self.logger.info(f"Skipping disabled website: {website['name']}")
                 continue
                 
-            scraper_class = scraper_classes.get(website['scraper_class'])
-            if scraper_class:
-                try:
-                    self.scrapers[website['name']] = scraper_class(website)
-                    self.logger.info(f"Initialized scraper for {website['name']}")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize scraper for {website['name']}: {e}")
+            self.init_scraper(website)
+
+    def init_scraper(self, website):
+        """Initialize the scraper instance for a single website"""
+        if website['scraper_class'] in self.SCRAPER_CLASSES:
+            try:
+                scraper_class = getattr(scrapers, website['scraper_class'])
+                self.scrapers[website['name']] = scraper_class(website, session=self._http_session)
+                self.logger.info(f"Initialized scraper for {website['name']}")
+            except Exception as e:
+                self.logger.error(f"Failed to initialize scraper for {website['name']}: {e}")
+        else:
+            self.logger.warning(f"No scraper class found for {website['scraper_class']}")
+
+    def _filter_seen_updates(self, updates, cycle_hashes):
+        """Drop updates already taken this cycle or stored within the dedup window"""
+        now = time.time()
+        fresh_updates = []
+        with self._recent_hashes_lock:
+            for update in updates:
+                content_hash = update.get('content_hash')
+                if content_hash in cycle_hashes or now - self._recent_hashes.get(content_hash, 0) < DEDUP_WINDOW:
+                    continue
+                if content_hash:
+                    cycle_hashes.add(content_hash)
+                fresh_updates.append(update)
+        return fresh_updates
+
+    def _remember_updates(self, updates):
+        """Record content hashes that are now in storage, evicting the oldest past the cap"""
+        now = time.time()
+        with self._recent_hashes_lock:
+            for update in updates:
+                content_hash = update.get('content_hash')
+                if content_hash:
+                    self._recent_hashes[content_hash] = now
+                    self._recent_hashes.move_to_end(content_hash)
+            while len(self._recent_hashes) > DEDUP_MAX_HASHES:
+                self._recent_hashes.popitem(last=False)
+
+    def forget_recent_updates(self):
+        """Drop the remembered content hashes, e.g. after stored updates were deleted"""
+        with self._recent_hashes_lock:
+            self._recent_hashes.clear()
+
+    def _timed_scrape(self, name, scraper):
+        """Run one scraper, returning its updates or error and the elapsed time"""
+        start_time = time.perf_counter()
+        try:
+            self.logger.info("Scraping %s...", name)
+            return scraper.scrape(), None, time.perf_counter() - start_time
+        except Exception as e:
+            return None, e, time.perf_counter() - start_time
+
+    def scrape_due_websites(self):
+        """Scrape only the websites whose adaptive interval has elapsed"""
+        now = time.monotonic()
+        due = [name for name in self.scrapers if self._next_due.get(name, 0) <= now]
+        # Nothing fetched means nothing to record, notify or report as the last scrape
+        if not due:
+            self.logger.info("No websites due for scraping")
+            return None
+        return self.scrape_all_websites(due)
+
+    def seconds_until_next_scrape(self):
+        """Seconds until the earliest enabled website is due; the scheduler sleeps this long"""
+        if not self.scrapers:
+            return SCRAPE_INTERVAL
+        next_due = min(self._next_due.get(name, 0) for name in self.scrapers)
+        return max(next_due - time.monotonic(), 0)
+
+    def _reschedule_website(self, name, stats, cycle_start):
+        """Back off sites that keep returning nothing new; reset active ones to the base interval"""
+        interval = self._site_intervals.get(name, SCRAPE_INTERVAL)
+        delay = interval
+        if stats['status'] == 'success':
+            self._consecutive_failures.pop(name, None)
+            if stats['updates_found']:
+                interval = delay = SCRAPE_INTERVAL
             else:
-                self.logger.warning(f"No scraper class found for {website['scraper_class']}")
+                interval = delay = min(interval * SCRAPE_BACKOFF_FACTOR, MAX_SCRAPE_INTERVAL)
+        else:
+            # Circuit breaker: a site that keeps failing is skipped for a doubling cooldown,
+            # then retried once (half-open) when it comes due again
+            failures = self._consecutive_failures.get(name, 0) + 1
+            self._consecutive_failures[name] = failures
+            delay = max(interval, min(SCRAPE_INTERVAL * 2 ** (failures - 1), CIRCUIT_BREAKER_MAX_COOLDOWN))
+            if failures > 1:
+                self.logger.warning("%s failed %d times in a row, skipping it for %.0f minutes", name, failures, delay / 60)
+        self._site_intervals[name] = interval
+        self._next_due[name] = cycle_start + delay
 
-    def scrape_all_websites(self):
-        """Scrape all configured websites"""
+    def scrape_all_websites(self, names=None):
+        """Scrape all configured websites, or only the named ones"""
         self.logger.info("Starting scraping cycle...")
-        all_new_updates = []
+        cycle_start = time.monotonic()
+        self._last_scrape = datetime.now().isoformat()
+        new_update_batches = []
+        new_updates_count = 0
         scraping_stats = {}
+        selected = list(self.scrapers.items()) if names is None else [
+            (name, self.scrapers[name]) for name in names if name in self.scrapers
+        ]
         
-        for name, scraper in self.scrapers.items():
-            start_time = time.time()
-            try:
-                self.logger.info(f"Scraping {name}...")
-                updates = scraper.scrape()
-                
-                if updates:
-                    self.logger.info(f"Found {len(updates)} updates from {name}")
-                    
-                    # Save raw scraped data directly to storage
-                    new_updates = self.storage.save_updates(updates)
-                    all_new_updates.extend(new_updates)
-                    
-                    # Log successful scraping
-                    duration = time.time() - start_time
-                    self.storage.log_scraping_attempt(
-                        source=name,
-                        status='success',
-                        updates_found=len(new_updates),
-                        duration=duration
-                    )
-                    
-                    scraping_stats[name] = {
-                        'status': 'success',
-                        'updates_found': len(new_updates),
-                        'duration': duration
-                    }
-                    
-                else:
-                    self.logger.info(f"No updates found from {name}")
-                    
-                    # Log successful scraping with no updates
-                    duration = time.time() - start_time
-                    self.storage.log_scraping_attempt(
-                        source=name,
-                        status='success',
-                        updates_found=0,
-                        duration=duration
-                    )
-                    
-                    scraping_stats[name] = {
-                        'status': 'success',
-                        'updates_found': 0,
-                        'duration': duration
-                    }
-                    
-            except Exception as e:
-                self.logger.error(f"Error scraping {name}: {e}")
-                
-                # Log failed scraping
-                duration = time.time() - start_time
-                self.storage.log_scraping_attempt(
-                    source=name,
-                    status='error',
-                    updates_found=0,
-                    error_message=str(e),
-                    duration=duration
-                )
+        # Fetch and parse every site concurrently on the shared scrape pool; results are held
+        # in memory and written together once the whole cycle has finished
+        futures = {
+            self._scrape_pool.submit(self._timed_scrape, name, scraper): name
+            for name, scraper in selected
+        }
+        pending_updates = []
+        # Content hashes already taken this cycle, so a page listed twice or on several sites is saved once
+        cycle_hashes = set()
+        
+        for future in as_completed(futures):
+            name = futures[future]
+            updates, error, duration = future.result()
+            # A failed scrape goes straight to the failure stats below; so does a failure handling its updates
+            if error is None:
+                try:
+                    if updates:
+                        self.logger.info("Found %d updates from %s", len(updates), name)
+                        
+                        # Skip items seen this cycle or stored recently; the rest are saved with the cycle's batch
+                        fresh_updates = self._filter_seen_updates(updates, cycle_hashes)
+                        if fresh_updates:
+                            pending_updates.append((name, fresh_updates))
+                        
+                    else:
+                        self.logger.info("No updates found from %s", name)
+                except Exception as e:
+                    error = e
+            
+            if error is not None:
+                self.logger.error("Error scraping %s: %s", name, error)
                 
                 scraping_stats[name] = {
                     'status': 'error',
                     'updates_found': 0,
                     'duration': duration,
-                    'error': str(e)
+                    'error': str(error)
+                }
+            else:
+                scraping_stats[name] = {
+                    'status': 'success',
+                    'updates_found': 0,
+                    'duration': duration
                 }
         
+        # Save every site's updates and log every attempt in a single transaction. The history lock is
+        # held until the cycle is recorded, so a get_status seeding the history from the committed
+        # rows in between cannot count this cycle twice
+        with self._scrape_history_lock:
+            try:
+                with self.storage.bulk_commit():
+                    for name, fresh_updates in pending_updates:
+                        new_updates = self.storage.save_updates(fresh_updates)
+                        new_update_batches.append(new_updates)
+                        new_updates_count += len(new_updates)
+                        scraping_stats[name]['updates_found'] = len(new_updates)
+                    
+                    self.storage.log_scraping_attempts([
+                        (name, stats['status'], stats['updates_found'], stats.get('error'), stats['duration'])
+                        for name, stats in scraping_stats.items()
+                    ])
+                
+                for _, fresh_updates in pending_updates:
+                    self._remember_updates(fresh_updates)
+            except Exception as e:
+                self.logger.error("Failed to save scraping results: %s", e)
+                new_update_batches = []
+                new_updates_count = 0
+                error_message = str(e)
+                for name, _ in pending_updates:
+                    scraping_stats[name].update({'status': 'error', 'updates_found': 0, 'error': error_message})
+            
+            self._record_scrape_history(scraping_stats)
+        
+        for name, stats in scraping_stats.items():
+            self._reschedule_website(name, stats, cycle_start)
+        
         # Process new updates with notification system
         notification_result = None
-        if all_new_updates:
-            self.logger.info(f"Processing {len(all_new_updates)} new updates with notification system...")
+        if new_updates_count:
+            self.logger.info("Processing %d new updates with notification system...", new_updates_count)
             try:
-                notification_result = self.notification_manager.process_next_scrape_cycle(all_new_updates)
-                self.logger.info(f"Notification processing completed: {notification_result['stats']['new_notifications']} new notifications")
+                notification_result = self.notification_manager.process_next_scrape_cycle(
+                    chain.from_iterable(new_update_batches)
+                )
+                self.logger.info(
+                    "Notification processing completed: %d new notifications",
+                    notification_result['stats']['new_notifications']
+                )
             except Exception as e:
-                self.logger.error(f"Error processing notifications: {e}")
+                self.logger.error("Error processing notifications: %s", e)
         else:
             self.logger.info("No new updates found in this cycle")
             # Clear notifications since no new data
             self.notification_manager.clear_notifications()
         
+        # Storage changed, so the next status poll or query must recompute its results
+        self._status_cache.clear()
+        
         return {
-            'new_updates_count': len(all_new_updates),
+            'new_updates_count': new_updates_count,
             'scraping_stats': scraping_stats,
             'notification_result': notification_result,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._last_scrape
         }
 
 
@@ -174,19 +356,94 @@ class MCPExamScrapingServer:
         self.scheduler.stop()
         self.logger.info("Scheduler stopped")
 
+    def shutdown(self):
+        """Stop scheduling and release the scrape workers, HTTP connections and database connection"""
+        self.stop_scheduler()
+        # Queued scrapes are dropped so they cannot hold up interpreter exit
+        self._scrape_pool.shutdown(wait=False, cancel_futures=True)
+        self._http_session.close()
+        self.storage.close_connections()
+        self.logger.info("Server shut down")
+
+    @contextmanager
+    def maintenance(self):
+        """Hold off scrape cycles while the shared storage is cleaned up or optimized"""
+        # Cycles save under the history lock, so no bulk transaction is open to make VACUUM hit a locked database
+        with self._scrape_history_lock:
+            try:
+                yield
+            finally:
+                # Deleted rows must be saved again if they reappear, not skipped as recently stored
+                self.forget_recent_updates()
+                self._status_cache.clear()
+
+    def _cached_status(self, key, compute):
+        """Return a cached query result, recomputing it after STATUS_CACHE_TTL seconds or a storage change"""
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached and now - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        value = compute()
+        self._status_cache[key] = (now, value)
+        return value
+
+    def _record_scrape_history(self, scraping_stats):
+        """Append a cycle's per-site outcomes to the in-memory 24h history (caller holds the history lock)"""
+        # Until the history is seeded from storage, these rows are picked up by the seed query
+        if self._scrape_history is not None:
+            now = time.time()
+            self._scrape_history.extend(
+                (now, name, stats['status'], stats['updates_found'], stats['duration'])
+                for name, stats in scraping_stats.items()
+            )
+
+    def _rolling_scraping_stats(self):
+        """Aggregate the last 24h of scraping attempts per source from memory"""
+        cutoff = time.time() - 24 * 60 * 60
+        with self._scrape_history_lock:
+            if self._scrape_history is None:
+                self._scrape_history = deque(self.storage.get_scraping_log(24))
+            while self._scrape_history and self._scrape_history[0][0] < cutoff:
+                self._scrape_history.popleft()
+            history = list(self._scrape_history)
+        
+        stats = {}
+        for _, source, status, updates_found, duration in history:
+            entry = stats.setdefault(source, {
+                'source': source,
+                'total_attempts': 0,
+                'successful_attempts': 0,
+                'total_updates': 0,
+                'total_duration': 0.0,
+                'timed_attempts': 0
+            })
+            entry['total_attempts'] += 1
+            entry['successful_attempts'] += status == 'success'
+            entry['total_updates'] += updates_found or 0
+            # Like SQL AVG, attempts without a recorded duration don't count towards the average
+            if duration is not None:
+                entry['total_duration'] += duration
+                entry['timed_attempts'] += 1
+        
+        for entry in stats.values():
+            total_duration = entry.pop('total_duration')
+            timed_attempts = entry.pop('timed_attempts')
+            entry['avg_duration'] = total_duration / timed_attempts if timed_attempts else None
+        return list(stats.values())
+
     def get_status(self):
         """Get server status"""
         try:
-            recent_updates = self.storage.get_recent_updates(24)
-            scraping_stats = self.storage.get_scraping_stats(24)
-            db_stats = self.storage.get_database_stats()
+            recent_updates_count = len(self.get_recent_updates(24))
+            scraping_stats = self._rolling_scraping_stats()
+            db_stats = self._cached_status('database_stats', self.storage.get_database_stats)
             
             return {
                 'status': 'running',
-                'last_scrape': datetime.now().isoformat(),
+                'last_scrape': self._last_scrape,
                 'total_scrapers': len(self.scrapers),
                 'active_scrapers': list(self.scrapers.keys()),
-                'recent_updates_24h': len(recent_updates),
+                'recent_updates_24h': recent_updates_count,
                 'scraping_stats_24h': scraping_stats,
                 'database_stats': db_stats,
                 'next_scheduled_run': self.scheduler.get_next_run_time(),
@@ -202,7 +459,11 @@ class MCPExamScrapingServer:
 
     def get_recent_updates(self, hours=24, limit=100):
         """Get recent updates"""
-        return self.storage.get_recent_updates(hours, limit)
+        # Only the 24h window polled by get_status is cached; other windows come from clients and
+        # would each leave an entry behind until the next cycle
+        if hours != 24 or limit != 100:
+            return self.storage.get_recent_updates(hours, limit)
+        return self._cached_status('recent_updates', lambda: self.storage.get_recent_updates(hours, limit))
 
     def get_updates_by_source(self, source, limit=50):
         """Get updates from specific source"""
@@ -214,7 +475,7 @@ class MCPExamScrapingServer:
 
     def get_all_exam_types(self):
         """Get all available exam types with counts"""
-        return self.storage.get_all_exam_types()
+        return self._cached_status('exam_types', self.storage.get_all_exam_types)
 
     def run_single_scrape(self):
         """Run scraping once without scheduling"""
@@ -269,17 +530,44 @@ class MCPExamScrapingServer:
                 'error': str(e)
             }
 
+    def test_website_config(self, website_config, sample_html=None, limit=3):
+        """Check a website configuration's selectors, returning up to limit updates, without storing or notifying"""
+        try:
+            if website_config.get('scraper_class') not in self.SCRAPER_CLASSES:
+                raise ValueError(f"No scraper class found for {website_config.get('scraper_class')}")
+            scraper_class = getattr(scrapers, website_config['scraper_class'])
+            scraper = scraper_class(website_config, session=self._http_session)
+
+            # Parse the supplied HTML if given, otherwise fetch the page once, without retries and
+            # with a short timeout; parsing runs the scraper's own page sections and stops at limit
+            if sample_html is None:
+                sample_html = scraper.fetch_html(retries=1, timeout=DRY_RUN_TIMEOUT)
+            updates = scraper.parse_content(sample_html, limit)
+            return {
+                'success': True,
+                'updates_found': len(updates),
+                'sample': updates
+            }
+        except Exception as e:
+            self.logger.error(f"Website config test failed: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
     def add_website(self, website_config):
         """Add new website to configuration"""
         try:
             self.website_configs['websites'].append(website_config)
+            self._websites_by_name[website_config['name']] = website_config
             
             # Save updated configuration
-            with open('config/websites.json', 'w') as f:
-                json.dump(self.website_configs, f, indent=2)
+            self.save_website_configs()
             
-            # Reinitialize scrapers
-            self.init_scrapers()
+            # Only the new website needs a scraper; existing ones are left as they are
+            if website_config.get('enabled', True):
+                self.init_scraper(website_config)
+            self._status_cache.clear()
             
             self.logger.info(f"Added new website: {website_config['name']}")
             return True
@@ -291,18 +579,17 @@ class MCPExamScrapingServer:
     def remove_website(self, website_name):
         """Remove website from configuration"""
         try:
-            self.website_configs['websites'] = [
-                w for w in self.website_configs['websites'] 
-                if w['name'] != website_name
-            ]
+            website = self._websites_by_name.pop(website_name, None)
+            if website is not None:
+                self.website_configs['websites'].remove(website)
             
             # Save updated configuration
-            with open('config/websites.json', 'w') as f:
-                json.dump(self.website_configs, f, indent=2)
+            self.save_website_configs()
             
             # Remove from active scrapers
             if website_name in self.scrapers:
                 del self.scrapers[website_name]
+            self._status_cache.clear()
             
             self.logger.info(f"Removed website: {website_name}")
             return True
@@ -322,17 +609,19 @@ class MCPExamScrapingServer:
     def _toggle_website(self, website_name, enabled):
         """Toggle website enabled/disabled status"""
         try:
-            for website in self.website_configs['websites']:
-                if website['name'] == website_name:
-                    website['enabled'] = enabled
-                    break
+            toggled = self._websites_by_name.get(website_name)
             
-            # Save updated configuration
-            with open('config/websites.json', 'w') as f:
-                json.dump(self.website_configs, f, indent=2)
+            # Only rewrite the configuration when the flag actually changes
+            if toggled is not None and toggled.get('enabled', True) != enabled:
+                toggled['enabled'] = enabled
+                self.save_website_configs()
             
-            # Reinitialize scrapers
-            self.init_scrapers()
+            # Start or drop just this website's scraper
+            if not enabled:
+                self.scrapers.pop(website_name, None)
+            elif toggled and website_name not in self.scrapers:
+                self.init_scraper(toggled)
+            self._status_cache.clear()
             
             status = "enabled" if enabled else "disabled"
             self.logger.info(f"{website_name} {status}")
@@ -1,11 +1,17 @@
 # Scrapers package for exam scraper
 
-from .base_scraper import BaseScraper
-from .nta_scraper import NTAScraper
-from .jee_advanced_scraper import JEEAdvancedScraper
-from .gate_scraper import GATEScraper
-from .upsc_scraper import UPSCScraper
-from .demo_scraper import DemoScraper
+import importlib
+
+# Scraper classes are imported on first access (PEP 562), so only the scrapers
+# that are actually enabled pay their module import cost
+_SCRAPER_MODULES = {
+    'BaseScraper': '.base_scraper',
+    'NTAScraper': '.nta_scraper',
+    'JEEAdvancedScraper': '.jee_advanced_scraper',
+    'GATEScraper': '.gate_scraper',
+    'UPSCScraper': '.upsc_scraper',
+    'DemoScraper': '.demo_scraper'
+}
 
 __all__ = [
     'BaseScraper',
@@ -15,3 +21,16 @@ __all__ = [
     'UPSCScraper',
     'DemoScraper'
 ]
+
+
+def __getattr__(name):
+    module_name = _SCRAPER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,76 @@
 import requests
-from bs4 import BeautifulSoup
-import hashlib
+from requests.adapters import HTTPAdapter
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import re
 from datetime import datetime
 import logging
 from abc import ABC, abstractmethod
-from urllib.parse import urljoin
-from config.settings import REQUEST_TIMEOUT, MAX_RETRIES, USER_AGENT
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+from config.settings import (
+    REQUEST_TIMEOUT, MAX_RETRIES, FETCH_RETRY_BUDGET, USER_AGENT, MAX_CONCURRENT_REQUESTS
+)
+from utils.helpers import generate_content_hash
+
+# Date formats found in notice titles, compiled once for every scraper
+TITLE_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',  # DD/MM/YYYY or DD-MM-YYYY
+    r'\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{4})\b',  # DD Month YYYY
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2}),?\s+(\d{4})\b',  # Month DD, YYYY
+))
+
+# All title formats in one alternation, so a title is scanned once; the earliest date in it wins
+TITLE_DATE_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in TITLE_DATE_PATTERNS), re.IGNORECASE)
+
+# Date fields may also use ISO-style ordering
+DATE_PATTERNS = (
+    TITLE_DATE_PATTERNS[0],
+    re.compile(r'\b(\d{4})[-/](\d{1,2})[-/](\d{1,2})\b'),  # YYYY/MM/DD or YYYY-MM-DD
+    *TITLE_DATE_PATTERNS[1:],
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_keyword_tuple(keywords):
+    """Build the keyword alternation once per distinct keyword list"""
+    alternatives = '|'.join(re.escape(keyword.lower()) for keyword in keywords)
+    # An empty alternation would match everything, so use a pattern that never matches instead
+    return re.compile(alternatives or r'(?!)')
 
 
 class BaseScraper(ABC):
-    def __init__(self, config):
+    # Classes of the site-specific sections a subclass reads besides the configured containers;
+    # when set, pages are parsed with a SoupStrainer that skips everything else
+    SECTION_CLASSES = ()
+    # Names of the methods that parse those sections, run in order after the configured containers
+    SECTION_PARSERS = ()
+
+    def __init__(self, config, session=None):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Scrapers created by the server share one session; standalone ones get their own
+        self.session = session if session is not None else self.create_session()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.keyword_pattern = self.compile_keywords(config.get('keywords', []))
+        # Compile the configured CSS selectors once instead of on every scrape
+        self.selectors = {
+            selector_type: self.compile_selectors(selector_string)
+            for selector_type, selector_string in config.get('selectors', {}).items()
+        }
+        self.strainer = self.build_strainer()
+        # Scheme and host of the site, used to resolve root-relative links without urljoin
+        site = urlsplit(config.get('url', ''))
+        self.site_root = f"{site.scheme}://{site.netloc}" if site.netloc else None
+
+    @staticmethod
+    def create_session(pool_size=MAX_CONCURRENT_REQUESTS):
+        """Create an HTTP session with browser headers and a pool sized for concurrent scrapes"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
             'User-Agent': USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -22,38 +78,103 @@ class BaseScraper(ABC):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
-        self.logger = logging.getLogger(self.__class__.__name__)
+        return session
+
+    @staticmethod
+    def compile_keywords(keywords):
+        """Compile keywords into one pattern that finds any of them in lowercased text"""
+        return _compile_keyword_tuple(tuple(keywords))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile_selectors(selector_string):
+        """Compile a comma separated selector string into an ordered tuple of selectors (cached per string)"""
+        return tuple(soupsieve.compile(selector.strip()) for selector in selector_string.split(', '))
+
+    def build_strainer(self):
+        """Build a SoupStrainer for the sections this scraper reads, or None to parse whole pages"""
+        if not self.SECTION_CLASSES:
+            return None
+        container_classes = []
+        for selector in self.selectors.get('news_container', []):
+            match = re.fullmatch(r'\.([\w-]+)', selector.pattern)
+            if not match:
+                # Anything beyond a bare class selector may need tags the strainer would drop
+                return None
+            container_classes.append(match.group(1))
+        wanted = frozenset((*self.SECTION_CLASSES, *container_classes))
+        # Match individual class tokens: a list passed as class_ never matches multi-class elements
+        # such as class="view view-what-new" on recent bs4 releases
+        return SoupStrainer(class_=lambda value: value is not None and not wanted.isdisjoint(value.split()))
+
+    def make_soup(self, html_content):
+        """Parse HTML, keeping only the strained sections when a strainer is set"""
+        return BeautifulSoup(html_content, 'lxml', parse_only=self.strainer)
 
-    def fetch_page(self, url, retries=MAX_RETRIES):
-        """Fetch webpage content with retry logic and exponential backoff"""
+    def fetch_page(self, url, retries=MAX_RETRIES, timeout=REQUEST_TIMEOUT):
+        """Fetch webpage content, retrying transient failures with exponential backoff"""
+        deadline = time.monotonic() + FETCH_RETRY_BUDGET
         for attempt in range(retries):
             try:
-                self.logger.info(f"Fetching {url} (attempt {attempt + 1}/{retries})")
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                self.logger.info("Fetching %s (attempt %d/%d)", url, attempt + 1, retries)
+                response = self.session.get(url, timeout=timeout)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt == retries - 1:
-                    self.logger.error(f"Max retries reached for {url}: {e}")
+                self.logger.warning("Attempt %d failed for %s: %s", attempt + 1, url, e)
+                delay = 2 ** attempt  # Exponential backoff
+                if not self.is_transient_error(e):
+                    self.logger.error("Not retrying %s: %s", url, e)
                     raise
-                time.sleep(2 ** attempt)  # Exponential backoff
+                if attempt == retries - 1 or time.monotonic() + delay > deadline:
+                    self.logger.error("Max retries reached for %s: %s", url, e)
+                    raise
+                time.sleep(delay)
+
+    def fetch_html(self, retries=MAX_RETRIES, timeout=REQUEST_TIMEOUT):
+        """Fetch the configured page's HTML"""
+        return self.fetch_page(self.config['url'], retries=retries, timeout=timeout).content
+
+    @staticmethod
+    def is_transient_error(error):
+        """Whether a request error may succeed on retry (network trouble, 429 or 5xx)"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        response = getattr(error, 'response', None)
+        if response is None:
+            return False
+        return response.status_code == 429 or response.status_code >= 500
 
-    def parse_content(self, html_content):
-        """Parse HTML content and extract updates"""
-        soup = BeautifulSoup(html_content, 'lxml')
+    def parse_content(self, html_content, limit=None):
+        """Parse HTML content and extract updates, stopping once limit updates are found"""
+        return self.parse_page(self.make_soup(html_content), limit)
+
+    def parse_page(self, soup, limit=None):
+        """Extract updates from the configured containers and then each page section, up to limit"""
+        updates = self.parse_soup(soup, limit)
+        for section_parser in self.SECTION_PARSERS:
+            if limit is not None and len(updates) >= limit:
+                break
+            updates.extend(getattr(self, section_parser)(soup))
+        return updates[:limit]
+
+    def parse_soup(self, soup, limit=None):
+        """Extract updates from the configured containers of a parsed page, up to limit"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         
         # Find news containers using multiple selectors
         containers = self.find_containers(soup)
         
         for container in containers:
+            if limit is not None and len(updates) >= limit:
+                break
             try:
-                update = self.extract_update_info(container)
+                update = self.extract_update_info(container, scraped_at)
                 if update and self.is_exam_related(update):
                     updates.append(update)
             except Exception as e:
-                self.logger.error(f"Error extracting update: {e}")
+                self.logger.error("Error extracting update: %s", e)
                 continue
                 
         return updates
@@ -61,30 +182,21 @@ class BaseScraper(ABC):
     def find_containers(self, soup):
         """Find news containers using adaptive parsing"""
         containers = []
-        selectors = self.config['selectors']['news_container'].split(', ')
         
-        for selector in selectors:
-            elements = soup.select(selector.strip())
+        for selector in self.selectors['news_container']:
+            elements = selector.select(soup)
             if elements:
                 containers.extend(elements)
-                self.logger.debug(f"Found {len(elements)} containers with selector: {selector}")
+                self.logger.debug("Found %d containers with selector: %s", len(elements), selector.pattern)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_containers = []
-        for container in containers:
-            container_id = id(container)
-            if container_id not in seen:
-                seen.add(container_id)
-                unique_containers.append(container)
-        
-        return unique_containers
+        # Remove duplicates while preserving order (by identity, overlapping selectors return the same tags)
+        return list({id(container): container for container in containers}.values())
 
-    def extract_update_info(self, container):
-        """Extract update information from container"""
-        title_elem = self.find_element(container, self.config['selectors']['title'])
-        date_elem = self.find_element(container, self.config['selectors']['date'])
-        link_elem = self.find_element(container, self.config['selectors']['link'])
+    def extract_update_info(self, container, scraped_at=None):
+        """Extract update information from container, stamped with scraped_at (defaults to now)"""
+        title_elem = self.find_element(container, self.selectors['title'])
+        date_elem = self.find_element(container, self.selectors['date'])
+        link_elem = self.find_element(container, self.selectors['link'])
         
         if not title_elem:
             return None
@@ -96,25 +208,30 @@ class BaseScraper(ABC):
         date = self.parse_date(date_elem.get_text(strip=True) if date_elem else "")
         link = self.resolve_url(link_elem.get('href') if link_elem else "")
         
-        # Generate content hash for change detection
-        content_hash = hashlib.md5(title.encode('utf-8')).hexdigest()
-        
+        return self.build_update(title, date, link, scraped_at or datetime.now().isoformat())
+
+    def build_update(self, title, date, url, scraped_at, priority='medium', content_summary=None):
+        """Build an update record; priority is the fallback when the website config sets none"""
+        # The summary (the title unless given) is what change detection hashes
+        if content_summary is None:
+            content_summary = title
         return {
             'title': title,
             'date': date,
-            'url': link,
-            'content_summary': title,  # Will be enhanced by AI
+            'url': url,
+            'content_summary': content_summary,  # Will be enhanced by AI
             'source': self.config['name'],
-            'scraped_at': datetime.now().isoformat(),
-            'content_hash': content_hash,
-            'priority': self.config.get('priority', 'medium')
+            'scraped_at': scraped_at,
+            'content_hash': generate_content_hash(content_summary),
+            'priority': self.config.get('priority', priority)
         }
 
-    def find_element(self, container, selector_string):
-        """Find element using multiple selectors"""
-        selectors = selector_string.split(', ')
+    def find_element(self, container, selectors):
+        """Find element using multiple selectors (compiled list or selector string)"""
+        if isinstance(selectors, str):
+            selectors = self.compile_selectors(selectors)
         for selector in selectors:
-            element = container.select_one(selector.strip())
+            element = selector.select_one(container)
             if element:
                 return element
         return None
@@ -122,24 +239,15 @@ class BaseScraper(ABC):
     def is_exam_related(self, update):
         """Check if update is exam-related using keywords"""
         text = (update['title'] + ' ' + update.get('content_summary', '')).lower()
-        keywords = [keyword.lower() for keyword in self.config['keywords']]
-        return any(keyword in text for keyword in keywords)
+        return self.keyword_pattern.search(text) is not None
 
     def parse_date(self, date_str):
         """Parse date string to standard format"""
         if not date_str:
             return datetime.now().strftime('%Y-%m-%d')
         
-        # Common date patterns
-        date_patterns = [
-            r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',  # DD/MM/YYYY or DD-MM-YYYY
-            r'\b(\d{4})[-/](\d{1,2})[-/](\d{1,2})\b',  # YYYY/MM/DD or YYYY-MM-DD
-            r'\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{4})\b',  # DD Month YYYY
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2}),?\s+(\d{4})\b',  # Month DD, YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 try:
                     if len(match.groups()) == 3:
@@ -152,12 +260,23 @@ class BaseScraper(ABC):
         
         return date_str
 
+    def extract_date_from_title(self, title):
+        """Extract date from title if present"""
+        match = TITLE_DATE_RE.search(title)
+        if match:
+            return match.group()
+        
+        return datetime.now().strftime('%Y-%m-%d')
+
     def resolve_url(self, url):
         """Resolve relative URLs to absolute"""
         if not url:
             return ""
         if url.startswith('http'):
             return url
+        # Most links are root-relative; dot segments and protocol-relative links still need urljoin
+        if self.site_root and url.startswith('/') and not url.startswith('//') and '/.' not in url:
+            return self.site_root + url
         return urljoin(self.config['url'], url)
 
     def get_fallback_selectors(self, selector_type):
@@ -179,20 +298,20 @@ class BaseScraper(ABC):
                 return func(*args, **kwargs)
             except (requests.ConnectionError, requests.Timeout) as e:
                 if attempt == max_retries - 1:
-                    self.logger.error(f"Max retries reached: {e}")
+                    self.logger.error("Max retries reached: %s", e)
                     raise
                 
                 delay = base_delay * (2 ** attempt)
-                self.logger.warning(f"Network error, retrying in {delay}s: {e}")
+                self.logger.warning("Network error, retrying in %ss: %s", delay, e)
                 time.sleep(delay)
             except requests.HTTPError as e:
                 if e.response.status_code == 429:  # Rate limited
                     delay = int(e.response.headers.get('Retry-After', 60))
-                    self.logger.warning(f"Rate limited, waiting {delay}s")
+                    self.logger.warning("Rate limited, waiting %ss", delay)
                     time.sleep(delay)
                 else:
                     raise
 
     @abstractmethod
     def scrape(self):
-        """Main scraping method to be implemented by subclasses"""
+        """Main scraping method to be implemented by subclasses; fetch errors must propagate to the caller"""
@@ -1,18 +1,18 @@
 import json
 import os
 import time
-import hashlib
 from datetime import datetime
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
+from utils.helpers import generate_content_hash, load_json, read_json
 
 
 class DemoScraper(BaseScraper):
     """Scraper for monitoring the demo HTML page"""
     
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
+    def __init__(self, config: Dict[str, Any], session=None):
+        super().__init__(config, session)
         self.demo_file_path = config.get('demo_file_path', 'demo_notifications.html')
         self.last_hash = None
         self.last_check = None
@@ -50,8 +50,7 @@ class DemoScraper(BaseScraper):
     def _extract_from_json_file(self, json_file: str) -> List[Dict[str, Any]]:
         """Extract notifications from JSON file"""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(json_file)
             
             notifications = []
             if isinstance(data, list):
@@ -69,27 +68,33 @@ class DemoScraper(BaseScraper):
     def _extract_from_html_file(self) -> List[Dict[str, Any]]:
         """Extract notifications from HTML file (fallback method)"""
         try:
-            with open(self.demo_file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract notifications from localStorage data (if available)
-            notifications = self._extract_notifications_from_html(soup)
-            
-            # Also try to extract from script tags
-            script_notifications = self._extract_notifications_from_scripts(soup)
-            
-            # Combine and deduplicate
-            all_notifications = notifications + script_notifications
-            unique_notifications = self._deduplicate_notifications(all_notifications)
-            
-            return unique_notifications
+            return self.parse_content(self.fetch_html())
             
         except Exception as e:
             self.logger.error(f"Error extracting from HTML file: {e}")
             return []
     
+    def fetch_html(self, retries=None, timeout=None) -> str:
+        """Read the local demo HTML file; its file:// URL cannot be fetched over HTTP"""
+        with open(self.demo_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def make_soup(self, html_content) -> BeautifulSoup:
+        """Parse the demo page with the built-in parser"""
+        return BeautifulSoup(html_content, 'html.parser')
+    
+    def parse_page(self, soup: BeautifulSoup, limit=None) -> List[Dict[str, Any]]:
+        """Extract notifications from the demo page's cards and scripts, up to limit"""
+        # Extract notifications from localStorage data (if available)
+        notifications = self._extract_notifications_from_html(soup)
+        
+        # Also try to extract from script tags, unless the cards already gave enough
+        if limit is None or len(notifications) < limit:
+            notifications += self._extract_notifications_from_scripts(soup)
+        
+        # Combine and deduplicate
+        return self._deduplicate_notifications(notifications)[:limit]
+    
     def _extract_notifications_from_html(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Extract notifications from HTML structure (fallback method)"""
         notifications = []
@@ -151,7 +156,7 @@ class DemoScraper(BaseScraper):
                 try:
                     # Decode the JSON data
                     json_data = match.replace('\\"', '"').replace("\\'", "'")
-                    data = json.loads(json_data)
+                    data = load_json(json_data)
                     
                     if isinstance(data, list):
                         for item in data:
@@ -209,7 +214,7 @@ class DemoScraper(BaseScraper):
             content_hash = self._generate_content_hash(title + content)
             
             return {
-                'id': f"demo_{int(time.time())}_{hashlib.md5(title.encode()).hexdigest()[:8]}",
+                'id': f"demo_{int(time.time())}_{generate_content_hash(title)[:8]}",
                 'title': title,
                 'content': content,
                 'content_summary': content[:200] + '...' if len(content) > 200 else content,
@@ -245,7 +250,7 @@ class DemoScraper(BaseScraper):
             for match in matches:
                 try:
                     # Try to parse as JSON
-                    data = json.loads(match)
+                    data = load_json(match)
                     if isinstance(data, list):
                         for item in data:
                             if isinstance(item, dict) and 'title' in item:
@@ -272,7 +277,7 @@ class DemoScraper(BaseScraper):
             content_hash = self._generate_content_hash(title + content)
             
             return {
-                'id': f"demo_{int(time.time())}_{hashlib.md5(title.encode()).hexdigest()[:8]}",
+                'id': f"demo_{int(time.time())}_{generate_content_hash(title)[:8]}",
                 'title': title,
                 'content': content,
                 'content_summary': content[:200] + '...' if len(content) > 200 else content,
@@ -305,7 +310,7 @@ class DemoScraper(BaseScraper):
     
     def _generate_content_hash(self, content: str) -> str:
         """Generate a hash for content deduplication"""
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return generate_content_hash(content)
     
     def check_for_changes(self) -> bool:
         """
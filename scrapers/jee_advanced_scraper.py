@@ -1,54 +1,46 @@
 from .base_scraper import BaseScraper
-from bs4 import BeautifulSoup
-import hashlib
 from datetime import datetime
-import re
 
 
 class JEEAdvancedScraper(BaseScraper):
+    RELEVANT_KEYWORDS = BaseScraper.compile_keywords([
+        'jee advanced', 'admit card', 'result', 'registration', 'application',
+        'exam date', 'notification', 'important', 'schedule', 'answer key',
+        'counselling', 'seat allotment', 'cutoff', 'merit list', 'rank list',
+        'qualifying criteria', 'eligibility', 'scorecard', 'josaa', 'allotment',
+        'round', 'deadline', 'withdrawal', 'aat', 'architecture', 'aptitude test',
+        'candidate portal', 'question paper', 'provisional', 'final', 'response'
+    ])
+
+    SECTION_PARSERS = (
+        'parse_marquee_section',  # Marquee section - main announcements
+        'parse_announcements_section',  # Announcements section
+    )
+
     def scrape(self):
         """Scrape JEE Advanced website"""
+        html = self.fetch_html()
         try:
-            response = self.fetch_page(self.config['url'])
-            updates = self.parse_content(response.text)
-            
-            # Additional JEE Advanced-specific parsing
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 1. Parse marquee section - main announcements
-            marquee_updates = self.parse_marquee_section(soup)
-            updates.extend(marquee_updates)
-            
-            # 2. Parse announcements section
-            announcements_updates = self.parse_announcements_section(soup)
-            updates.extend(announcements_updates)
-            
-            return updates
-            
+            return self.parse_page(self.make_soup(html))
         except Exception as e:
-            self.logger.error(f"Error scraping JEE Advanced website: {e}")
+            self.logger.error(f"Error parsing JEE Advanced website: {e}")
             return []
 
     def parse_marquee_section(self, soup):
         """Parse the marquee section for main announcements"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find the marquee element
-            marquee = soup.select_one('marquee')
+            marquee = soup.find('marquee')
             if marquee:
                 content = marquee.get_text(strip=True)
-                if self.is_relevant_jee_advanced_update(content) and len(content) > 20:
-                    update = {
-                        'title': content,
-                        'date': self.extract_date_from_title(content),
-                        'url': self.config['url'],
-                        'content_summary': content,
-                        'source': self.config['name'],
-                        'scraped_at': datetime.now().isoformat(),
-                        'content_hash': hashlib.md5(content.encode('utf-8')).hexdigest(),
-                        'priority': self.config.get('priority', 'high')
-                    }
-                    updates.append(update)
+                if len(content) > 20 and self.is_relevant_jee_advanced_update(content):
+                    updates.append(self.build_update(
+                        content, self.extract_date_from_title(content),
+                        self.config['url'],
+                        scraped_at, 'high'
+                    ))
                     
         except Exception as e:
             self.logger.error(f"Error parsing JEE Advanced marquee section: {e}")
@@ -58,9 +50,10 @@ class JEEAdvancedScraper(BaseScraper):
     def parse_announcements_section(self, soup):
         """Parse the announcements section"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find announcement items
-            announcements = soup.select('.announcement__head')
+            announcements = soup.find_all(class_='announcement__head')
             for announcement in announcements:
                 try:
                     title = announcement.get_text(strip=True)
@@ -69,24 +62,18 @@ class JEEAdvancedScraper(BaseScraper):
                         parent = announcement.find_parent()
                         if parent:
                             # Look for links in the announcement
-                            link_elem = parent.select_one('a')
+                            link_elem = parent.find('a')
                             href = link_elem.get('href', '') if link_elem else ''
                             
                             # Look for date in the announcement
-                            date_elem = parent.select_one('.font-monospace')
+                            date_elem = parent.find(class_='font-monospace')
                             date_text = date_elem.get_text(strip=True) if date_elem else self.extract_date_from_title(title)
                             
-                            update = {
-                                'title': title,
-                                'date': self.parse_date(date_text),
-                                'url': self.resolve_url(href) if href else self.config['url'],
-                                'content_summary': title,
-                                'source': self.config['name'],
-                                'scraped_at': datetime.now().isoformat(),
-                                'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                                'priority': self.config.get('priority', 'high')
-                            }
-                            updates.append(update)
+                            updates.append(self.build_update(
+                                title, self.parse_date(date_text),
+                                self.resolve_url(href) if href else self.config['url'],
+                                scraped_at, 'high'
+                            ))
                             
                 except Exception as e:
                     self.logger.error(f"Error processing JEE Advanced announcement: {e}")
@@ -98,28 +85,4 @@ class JEEAdvancedScraper(BaseScraper):
 
     def is_relevant_jee_advanced_update(self, title):
         """Check if JEE Advanced update is relevant"""
-        relevant_keywords = [
-            'jee advanced', 'admit card', 'result', 'registration', 'application',
-            'exam date', 'notification', 'important', 'schedule', 'answer key',
-            'counselling', 'seat allotment', 'cutoff', 'merit list', 'rank list',
-            'qualifying criteria', 'eligibility', 'scorecard', 'josaa', 'allotment',
-            'round', 'deadline', 'withdrawal', 'aat', 'architecture', 'aptitude test',
-            'candidate portal', 'question paper', 'provisional', 'final', 'response'
-        ]
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in relevant_keywords)
-
-    def extract_date_from_title(self, title):
-        """Extract date from title if present"""
-        date_patterns = [
-            r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',
-            r'\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{4})\b',
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2}),?\s+(\d{4})\b'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group()
-        
-        return datetime.now().strftime('%Y-%m-%d')
+        return self.RELEVANT_KEYWORDS.search(title.lower()) is not None
@@ -1,96 +1,85 @@
 from .base_scraper import BaseScraper
-from bs4 import BeautifulSoup
-import hashlib
+import soupsieve
 from datetime import datetime
-import re
 
 
 class UPSCScraper(BaseScraper):
+    RELEVANT_KEYWORDS = BaseScraper.compile_keywords([
+        'upsc', 'civil services', 'ias', 'ips', 'ifs', 'irs', 'exam', 'notification',
+        'result', 'admit card', 'application', 'registration', 'important', 'schedule',
+        'answer key', 'interview', 'personality test', 'final result', 'merit list',
+        'cutoff', 'qualifying criteria', 'eligibility', 'syllabus', 'pattern',
+        'preliminary', 'mains', 'optional', 'general studies', 'engineering services',
+        'medical services', 'defence', 'academy', 'recruitment', 'advertisement',
+        'corrigendum', 'addendum', 'notice', 'press note', 'written result',
+        'interview schedule', 'final result', 'reserve list', 'marks', 'answer key'
+    ])
+
+    WHATS_NEW_CONTENT = soupsieve.compile('.view-what-new .view-content')
+    TICKER_CONTENT = soupsieve.compile('.view-ticker .view-content')
+    EXAMS_CONTENT = soupsieve.compile('.view-exams .view-content')
+    HEADER_LINKS = soupsieve.compile('.view-what-new .view-header a')
+
+    SECTION_CLASSES = ('view-what-new', 'view-ticker', 'view-exams')
+    SECTION_PARSERS = (
+        'parse_whats_new_section',  # "What's New" section - main updates
+        'parse_ticker_section',  # Ticker section - important announcements
+        'parse_forthcoming_exams',  # Forthcoming examinations section
+        'parse_header_announcements',  # Header announcements (static links in view-header)
+    )
+
     def scrape(self):
         """Scrape UPSC website"""
+        html = self.fetch_html()
         try:
-            response = self.fetch_page(self.config['url'])
-            updates = self.parse_content(response.text)
-            
-            # Additional UPSC-specific parsing
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 1. Parse "What's New" section - main updates
-            whats_new_updates = self.parse_whats_new_section(soup)
-            updates.extend(whats_new_updates)
-            
-            # 2. Parse ticker section - important announcements
-            ticker_updates = self.parse_ticker_section(soup)
-            updates.extend(ticker_updates)
-            
-            # 3. Parse forthcoming examinations section
-            exam_updates = self.parse_forthcoming_exams(soup)
-            updates.extend(exam_updates)
-            
-            # 4. Parse header announcements (static links in view-header)
-            header_updates = self.parse_header_announcements(soup)
-            updates.extend(header_updates)
-            
-            return updates
-            
+            return self.parse_page(self.make_soup(html))
         except Exception as e:
-            self.logger.error(f"Error scraping UPSC website: {e}")
+            self.logger.error(f"Error parsing UPSC website: {e}")
             return []
 
     def parse_whats_new_section(self, soup):
         """Parse the 'What's New' section for updates"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find the main "What's New" view content
-            view_content = soup.select_one('.view-what-new .view-content')
+            view_content = self.WHATS_NEW_CONTENT.select_one(soup)
             if not view_content:
                 return updates
             
             # Parse each views-row in the content
-            rows = view_content.select('.views-row')
+            rows = view_content.find_all(class_='views-row')
             for row in rows[:20]:  # Limit to 20 most recent
                 try:
                     # Look for exam name field
-                    exam_name_field = row.select_one('.views-field-field-exam-name')
+                    exam_name_field = row.find(class_='views-field-field-exam-name')
                     if exam_name_field:
-                        link_elem = exam_name_field.select_one('a')
+                        link_elem = exam_name_field.find('a')
                         if link_elem:
                             title = link_elem.get_text(strip=True)
                             href = link_elem.get('href', '')
                             
                             if self.is_relevant_upsc_update(title):
-                                update = {
-                                    'title': title,
-                                    'date': self.extract_date_from_title(title),
-                                    'url': self.resolve_url(href),
-                                    'content_summary': title,
-                                    'source': self.config['name'],
-                                    'scraped_at': datetime.now().isoformat(),
-                                    'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                                    'priority': self.config.get('priority', 'high')
-                                }
-                                updates.append(update)
+                                updates.append(self.build_update(
+                                    title, self.extract_date_from_title(title),
+                                    self.resolve_url(href),
+                                    scraped_at, 'high'
+                                ))
                     
                     # Also check for post/vacancy field
-                    post_field = row.select_one('.views-field-field-name-of-post-vaccancy')
+                    post_field = row.find(class_='views-field-field-name-of-post-vaccancy')
                     if post_field:
-                        link_elem = post_field.select_one('a')
+                        link_elem = post_field.find('a')
                         if link_elem:
                             title = link_elem.get_text(strip=True)
                             href = link_elem.get('href', '')
                             
-                            if self.is_relevant_upsc_update(title) and len(title) > 10:
-                                update = {
-                                    'title': title,
-                                    'date': self.extract_date_from_title(title),
-                                    'url': self.resolve_url(href),
-                                    'content_summary': title,
-                                    'source': self.config['name'],
-                                    'scraped_at': datetime.now().isoformat(),
-                                    'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                                    'priority': self.config.get('priority', 'high')
-                                }
-                                updates.append(update)
+                            if len(title) > 10 and self.is_relevant_upsc_update(title):
+                                updates.append(self.build_update(
+                                    title, self.extract_date_from_title(title),
+                                    self.resolve_url(href),
+                                    scraped_at, 'high'
+                                ))
                                 
                 except Exception as e:
                     self.logger.error(f"Error processing What's New row: {e}")
@@ -103,33 +92,28 @@ class UPSCScraper(BaseScraper):
     def parse_ticker_section(self, soup):
         """Parse the ticker section for important announcements"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find the ticker view
-            ticker_view = soup.select_one('.view-ticker .view-content')
+            ticker_view = self.TICKER_CONTENT.select_one(soup)
             if not ticker_view:
                 return updates
             
             # Parse ticker table rows
-            table_rows = ticker_view.select('th.views-field-title')
+            table_rows = ticker_view.find_all('th', class_='views-field-title')
             for row in table_rows:
                 try:
-                    link_elem = row.select_one('a')
+                    link_elem = row.find('a')
                     if link_elem:
                         title = link_elem.get_text(strip=True)
                         href = link_elem.get('href', '')
                         
-                        if self.is_relevant_upsc_update(title) and len(title) > 15:
-                            update = {
-                                'title': title,
-                                'date': self.extract_date_from_title(title),
-                                'url': self.resolve_url(href),
-                                'content_summary': title,
-                                'source': self.config['name'],
-                                'scraped_at': datetime.now().isoformat(),
-                                'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                                'priority': self.config.get('priority', 'high')
-                            }
-                            updates.append(update)
+                        if len(title) > 15 and self.is_relevant_upsc_update(title):
+                            updates.append(self.build_update(
+                                title, self.extract_date_from_title(title),
+                                self.resolve_url(href),
+                                scraped_at, 'high'
+                            ))
                             
                 except Exception as e:
                     self.logger.error(f"Error processing ticker row: {e}")
@@ -142,35 +126,30 @@ class UPSCScraper(BaseScraper):
     def parse_forthcoming_exams(self, soup):
         """Parse the forthcoming examinations section"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find the forthcoming exams view
-            exam_view = soup.select_one('.view-exams .view-content')
+            exam_view = self.EXAMS_CONTENT.select_one(soup)
             if not exam_view:
                 return updates
             
             # Parse exam rows
-            exam_rows = exam_view.select('.views-row')
+            exam_rows = exam_view.find_all(class_='views-row')
             for row in exam_rows:
                 try:
-                    exam_field = row.select_one('.views-field-field-exam-name')
+                    exam_field = row.find(class_='views-field-field-exam-name')
                     if exam_field:
-                        link_elem = exam_field.select_one('a')
+                        link_elem = exam_field.find('a')
                         if link_elem:
                             title = link_elem.get_text(strip=True)
                             href = link_elem.get('href', '')
                             
                             if self.is_relevant_upsc_update(title):
-                                update = {
-                                    'title': f"Forthcoming: {title}",
-                                    'date': self.extract_date_from_title(title),
-                                    'url': self.resolve_url(href),
-                                    'content_summary': title,
-                                    'source': self.config['name'],
-                                    'scraped_at': datetime.now().isoformat(),
-                                    'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                                    'priority': self.config.get('priority', 'medium')
-                                }
-                                updates.append(update)
+                                updates.append(self.build_update(
+                                    f"Forthcoming: {title}", self.extract_date_from_title(title),
+                                    self.resolve_url(href),
+                                    scraped_at, 'medium', content_summary=title
+                                ))
                                 
                 except Exception as e:
                     self.logger.error(f"Error processing forthcoming exam row: {e}")
@@ -183,26 +162,21 @@ class UPSCScraper(BaseScraper):
     def parse_header_announcements(self, soup):
         """Parse header announcements from view-header"""
         updates = []
+        scraped_at = datetime.now().isoformat()
         try:
             # Find header announcements in the What's New view-header
-            header_links = soup.select('.view-what-new .view-header a')
+            header_links = self.HEADER_LINKS.select(soup)
             for link in header_links:
                 try:
                     title = link.get_text(strip=True)
                     href = link.get('href', '')
                     
-                    if self.is_relevant_upsc_update(title) and len(title) > 20:
-                        update = {
-                            'title': title,
-                            'date': self.extract_date_from_title(title),
-                            'url': self.resolve_url(href),
-                            'content_summary': title,
-                            'source': self.config['name'],
-                            'scraped_at': datetime.now().isoformat(),
-                            'content_hash': hashlib.md5(title.encode('utf-8')).hexdigest(),
-                            'priority': self.config.get('priority', 'high')
-                        }
-                        updates.append(update)
+                    if len(title) > 20 and self.is_relevant_upsc_update(title):
+                        updates.append(self.build_update(
+                            title, self.extract_date_from_title(title),
+                            self.resolve_url(href),
+                            scraped_at, 'high'
+                        ))
                         
                 except Exception as e:
                     self.logger.error(f"Error processing header announcement: {e}")
@@ -214,30 +188,4 @@ class UPSCScraper(BaseScraper):
 
     def is_relevant_upsc_update(self, title):
         """Check if UPSC update is relevant"""
-        relevant_keywords = [
-            'upsc', 'civil services', 'ias', 'ips', 'ifs', 'irs', 'exam', 'notification',
-            'result', 'admit card', 'application', 'registration', 'important', 'schedule',
-            'answer key', 'interview', 'personality test', 'final result', 'merit list',
-            'cutoff', 'qualifying criteria', 'eligibility', 'syllabus', 'pattern',
-            'preliminary', 'mains', 'optional', 'general studies', 'engineering services',
-            'medical services', 'defence', 'academy', 'recruitment', 'advertisement',
-            'corrigendum', 'addendum', 'notice', 'press note', 'written result',
-            'interview schedule', 'final result', 'reserve list', 'marks', 'answer key'
-        ]
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in relevant_keywords)
-
-    def extract_date_from_title(self, title):
-        """Extract date from title if present"""
-        date_patterns = [
-            r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',
-            r'\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{4})\b',
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2}),?\s+(\d{4})\b'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group()
-        
-        return datetime.now().strftime('%Y-%m-%d')
+        return self.RELEVANT_KEYWORDS.search(title.lower()) is not None
@@ -0,0 +1,27 @@
+import os
+import threading
+
+from utils.helpers import read_json, write_json_atomic
+
+
+def test_write_json_atomic_with_concurrent_writers(tmp_path):
+    path = str(tmp_path / 'queue.json')
+    errors = []
+    
+    def writer(worker):
+        try:
+            for attempt in range(50):
+                write_json_atomic(path, {'worker': worker, 'attempt': attempt, 'items': list(range(200))})
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=writer, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert read_json(path)['items'] == list(range(200))
+    # No temp files are left behind
+    assert os.listdir(tmp_path) == ['queue.json']
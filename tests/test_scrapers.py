@@ -0,0 +1,89 @@
+import pytest
+import requests
+
+from scrapers import NTAScraper, UPSCScraper, base_scraper
+
+UPSC_CONFIG = {
+    'name': 'UPSC',
+    'url': 'https://upsc.gov.in/',
+    'scraper_class': 'UPSCScraper',
+    'keywords': ['upsc', 'examination'],
+    'selectors': {
+        'news_container': '.whats-new, .latest-updates, .announcements',
+        'title': 'h3, .title, .announcement-title',
+        'date': '.date, .publish-date',
+        'link': 'a'
+    }
+}
+
+NTA_CONFIG = {
+    'name': 'JEE Main NTA',
+    'url': 'https://jeemain.nta.nic.in/',
+    'scraper_class': 'NTAScraper',
+    'keywords': ['jee main', 'admit card'],
+    'selectors': {
+        'news_container': '.latest-news, .updates, .notifications, .notification-list',
+        'title': 'h3, h4, .title, a',
+        'date': '.date, .publish-date, .timestamp',
+        'link': 'a'
+    }
+}
+
+# Drupal views render several classes on every wrapper element
+UPSC_PAGE = """
+<html><body>
+<div class="view view-what-new view-id-what_new view-display-id-block">
+  <div class="view-header"><a href="/notices/header">Notice regarding Civil Services Examination 2026 schedule</a></div>
+  <div class="view-content">
+    <div class="views-row views-row-1 views-row-odd">
+      <div class="views-field views-field-field-exam-name"><a href="/exams/cse">Civil Services Exam 2026</a></div>
+      <div class="views-field views-field-field-name-of-post-vaccancy"><a href="/recruitment/1">Recruitment result for Assistant Professor</a></div>
+    </div>
+  </div>
+</div>
+<div class="footer">Unrelated</div>
+</body></html>
+"""
+
+NTA_PAGE = """
+<html><body>
+<div class="latest-news item"><h3>JEE Main 2026 admit card released</h3><a href="/admit-card">Download</a></div>
+<div class="newsticker flexslider"><ul class="slides"><li><a href="/result">JEE Main 2026 session 1 result announced</a></li></ul></div>
+</body></html>
+"""
+
+
+def test_strainer_keeps_multi_class_sections():
+    scraper = UPSCScraper(UPSC_CONFIG)
+    soup = scraper.make_soup(UPSC_PAGE)
+    
+    titles = [update['title'] for update in scraper.parse_whats_new_section(soup)]
+    assert titles == ['Civil Services Exam 2026', 'Recruitment result for Assistant Professor']
+    
+    headers = scraper.parse_header_announcements(soup)
+    assert [update['url'] for update in headers] == ['https://upsc.gov.in/notices/header']
+    
+    # Sections nobody reads are left out of the tree
+    assert soup.find(class_='footer') is None
+
+
+def test_strainer_keeps_multi_class_containers():
+    scraper = NTAScraper(NTA_CONFIG)
+    soup = scraper.make_soup(NTA_PAGE)
+    
+    assert [update['title'] for update in scraper.parse_soup(soup)] == ['JEE Main 2026 admit card released']
+    assert [update['title'] for update in scraper.parse_news_ticker(soup)] == ['JEE Main 2026 session 1 result announced']
+
+
+class _UnreachableSession:
+    def get(self, url, timeout=None):
+        raise requests.ConnectionError(f"cannot reach {url}")
+
+
+def test_scrape_raises_when_the_page_cannot_be_fetched(monkeypatch):
+    monkeypatch.setattr(base_scraper.time, 'sleep', lambda seconds: None)
+    scraper = NTAScraper(NTA_CONFIG, session=_UnreachableSession())
+    
+    # The server's circuit breaker only sees failures that reach it
+    with pytest.raises(requests.ConnectionError):
+        scraper.scrape()
@@ -0,0 +1,292 @@
+import json
+
+import pytest
+
+from config.settings import (
+    SCRAPE_INTERVAL, MAX_SCRAPE_INTERVAL, SCRAPE_BACKOFF_FACTOR, CIRCUIT_BREAKER_MAX_COOLDOWN,
+    STATUS_CACHE_TTL
+)
+from data.storage import DataStorage
+from mcp_server import server as server_module
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    # Keep every file the server touches inside the test directory
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / 'websites.json'
+    config_file.write_text(json.dumps({'websites': []}))
+    monkeypatch.setattr(server_module, 'WEBSITES_CONFIG_FILE', str(config_file))
+    monkeypatch.setattr(server_module, 'DataStorage', lambda: DataStorage(str(tmp_path / 'data' / 'test.db')))
+    monkeypatch.setattr(server_module.MCPExamScrapingServer, 'setup_logging', lambda self: None)
+    
+    instance = server_module.MCPExamScrapingServer()
+    # New updates are counted instead of going to the notification files and webhook queue
+    monkeypatch.setattr(
+        instance.notification_manager, 'process_next_scrape_cycle',
+        lambda updates: {'stats': {'new_notifications': len(list(updates))}}
+    )
+    yield instance
+    instance.shutdown()
+
+
+class _StaticScraper:
+    def __init__(self, *updates):
+        self.updates = list(updates)
+    
+    def scrape(self):
+        return [dict(update) for update in self.updates]
+
+
+def _update(content_hash, source='UPSC'):
+    return {'title': f'Notice {content_hash}', 'source': source, 'scraped_at': '2026-10-16T10:00:00',
+            'content_hash': content_hash}
+
+
+def _stored_hashes(server):
+    return {row[0] for row in server.storage.connection().execute('SELECT content_hash FROM updates')}
+
+
+def _success(updates_found):
+    return {'status': 'success', 'updates_found': updates_found, 'duration': 0.1}
+
+
+def test_interval_grows_while_site_returns_nothing_new(server):
+    server._reschedule_website('UPSC', _success(0), 1000)
+    assert server._site_intervals['UPSC'] == SCRAPE_INTERVAL * SCRAPE_BACKOFF_FACTOR
+    assert server._next_due['UPSC'] == 1000 + SCRAPE_INTERVAL * SCRAPE_BACKOFF_FACTOR
+    
+    server._reschedule_website('UPSC', _success(0), 2000)
+    assert server._site_intervals['UPSC'] == SCRAPE_INTERVAL * SCRAPE_BACKOFF_FACTOR ** 2
+
+
+def test_interval_resets_when_updates_are_found(server):
+    for _ in range(3):
+        server._reschedule_website('UPSC', _success(0), 1000)
+    
+    server._reschedule_website('UPSC', _success(2), 5000)
+    assert server._site_intervals['UPSC'] == SCRAPE_INTERVAL
+    assert server._next_due['UPSC'] == 5000 + SCRAPE_INTERVAL
+
+
+def test_interval_is_clamped_to_the_maximum(server):
+    for _ in range(20):
+        server._reschedule_website('UPSC', _success(0), 1000)
+    assert server._site_intervals['UPSC'] == MAX_SCRAPE_INTERVAL
+
+
+def test_failing_site_cools_down_and_recovers(server):
+    error = {'status': 'error', 'updates_found': 0, 'duration': 0.1, 'error': 'timeout'}
+    
+    cooldowns = []
+    for _ in range(12):
+        server._reschedule_website('GATE', error, 0)
+        cooldowns.append(server._next_due['GATE'])
+    # Each consecutive failure doubles the cooldown up to the ceiling
+    assert cooldowns[:3] == [SCRAPE_INTERVAL, 2 * SCRAPE_INTERVAL, 4 * SCRAPE_INTERVAL]
+    assert cooldowns[-1] == CIRCUIT_BREAKER_MAX_COOLDOWN
+    
+    server._reschedule_website('GATE', _success(1), 0)
+    assert 'GATE' not in server._consecutive_failures
+    assert server._next_due['GATE'] == SCRAPE_INTERVAL
+
+
+def test_scheduler_sleeps_until_the_earliest_site_is_due(server, monkeypatch):
+    server.scrapers = {'UPSC': object(), 'GATE': object()}
+    monkeypatch.setattr(server_module.time, 'monotonic', lambda: 1000)
+    server._next_due = {'UPSC': 1000 + 2700, 'GATE': 1000 + 4050}
+    assert server.seconds_until_next_scrape() == 2700
+    
+    # A site that was never scraped is due straight away
+    server.scrapers['JEE Advanced'] = object()
+    assert server.seconds_until_next_scrape() == 0
+
+
+def test_maintenance_uses_the_shared_storage(server, monkeypatch):
+    created = []
+    monkeypatch.setattr('data.storage.DataStorage', lambda: created.append(1))
+    calls = []
+    
+    def optimize_database():
+        # Scrape cycles save under the history lock, so none can be mid-transaction here
+        calls.append(server._scrape_history_lock.locked())
+        return False
+    
+    monkeypatch.setattr(server.storage, 'optimize_database', optimize_database)
+    server.scheduler.weekly_optimization()
+    server.scheduler.daily_cleanup()
+    
+    assert calls == [True]
+    assert created == []
+
+
+def test_update_listed_twice_in_a_cycle_is_saved_once(server):
+    server.scrapers = {
+        'UPSC': _StaticScraper(_update('a'), _update('a')),
+        'UPSC mirror': _StaticScraper(_update('a', 'UPSC mirror'), _update('b', 'UPSC mirror')),
+    }
+    
+    result = server.scrape_all_websites()
+    
+    assert result['new_updates_count'] == 2
+    assert _stored_hashes(server) == {'a', 'b'}
+
+
+def test_recently_stored_updates_are_skipped_until_maintenance(server, monkeypatch):
+    server.scrapers = {'UPSC': _StaticScraper(_update('a'))}
+    server.scrape_all_websites()
+    
+    saved = []
+    save_updates = server.storage.save_updates
+    monkeypatch.setattr(server.storage, 'save_updates', lambda updates: saved.append(updates) or save_updates(updates))
+    
+    # The next cycle doesn't even ask storage about an update it just stored
+    assert server.scrape_all_websites()['new_updates_count'] == 0
+    assert saved == []
+    
+    # Once cleanup deletes the row, the same update is stored again
+    with server.maintenance():
+        conn = server.storage.connection()
+        conn.execute('DELETE FROM updates')
+        conn.commit()
+    assert server.scrape_all_websites()['new_updates_count'] == 1
+    assert _stored_hashes(server) == {'a'}
+
+
+def test_status_cache_expires_quickly_and_after_maintenance(server, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(server_module.time, 'monotonic', lambda: clock[0])
+    computed = []
+    compute = lambda: computed.append(1) or len(computed)
+    
+    assert server._cached_status('database_stats', compute) == 1
+    assert server._cached_status('database_stats', compute) == 1
+    
+    clock[0] += STATUS_CACHE_TTL
+    assert server._cached_status('database_stats', compute) == 2
+    
+    with server.maintenance():
+        pass
+    assert server._cached_status('database_stats', compute) == 3
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.urls = []
+    
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        raise AssertionError(f"unexpected request to {url}")
+    
+    def close(self):
+        pass
+
+
+NTA_DRY_RUN_CONFIG = {
+    'name': 'JEE Main NTA',
+    'url': 'https://jeemain.nta.nic.in/',
+    'scraper_class': 'NTAScraper',
+    'keywords': ['jee main'],
+    'selectors': {'news_container': '.latest-news', 'title': 'h3', 'date': '.date', 'link': 'a'}
+}
+
+
+def test_dry_run_parses_sample_html_without_fetching(server, monkeypatch):
+    session = _RecordingSession()
+    monkeypatch.setattr(server, '_http_session', session)
+    sample_html = (
+        '<div class="latest-news"><h3>JEE Main 2026 city slip out</h3></div>'
+        '<div class="newsticker"><ul class="slides"><li><a href="/result">JEE Main 2026 session 1 result announced</a></li></ul></div>'
+    )
+    
+    result = server.test_website_config(NTA_DRY_RUN_CONFIG, sample_html=sample_html)
+    
+    assert result['success']
+    # The site's own section parsers run as well as the configured containers
+    assert [update['title'] for update in result['sample']] == [
+        'JEE Main 2026 city slip out', 'JEE Main 2026 session 1 result announced'
+    ]
+    assert session.urls == []
+
+
+def test_dry_run_stops_parsing_at_the_limit(server, monkeypatch):
+    from scrapers.nta_scraper import NTAScraper
+    
+    extracted = []
+    extract_update_info = NTAScraper.extract_update_info
+    monkeypatch.setattr(
+        NTAScraper, 'extract_update_info',
+        lambda self, container, scraped_at=None: extracted.append(1) or extract_update_info(self, container, scraped_at)
+    )
+    ticker = []
+    monkeypatch.setattr(NTAScraper, 'parse_news_ticker', lambda self, soup: ticker.append(1) or [])
+    sample_html = ''.join(f'<div class="latest-news"><h3>JEE Main 2026 notice {i}</h3></div>' for i in range(10))
+    
+    result = server.test_website_config(NTA_DRY_RUN_CONFIG, sample_html=sample_html, limit=2)
+    
+    assert result['updates_found'] == 2
+    assert len(extracted) == 2
+    assert ticker == []
+
+
+def test_dry_run_reads_the_demo_page_from_disk(server, tmp_path, monkeypatch):
+    session = _RecordingSession()
+    monkeypatch.setattr(server, '_http_session', session)
+    demo_page = tmp_path / 'demo_notifications.html'
+    demo_page.write_text(
+        '<div class="notification-card gate"><div class="notification-title">GATE 2026 admit card</div>'
+        '<div class="notification-content">Admit cards are out</div></div>'
+    )
+    config = {
+        'name': 'Demo Notifications',
+        'url': 'file://demo_notifications.html',
+        'scraper_class': 'DemoScraper',
+        'demo_file_path': str(demo_page),
+        'selectors': {'news_container': '.notification-card', 'title': '.notification-title'}
+    }
+    
+    result = server.test_website_config(config)
+    
+    assert result['success']
+    assert [update['title'] for update in result['sample']] == ['GATE 2026 admit card']
+    assert session.urls == []
+
+
+def test_failure_while_saving_rolls_back_the_whole_cycle(server, tmp_path, monkeypatch):
+    server.scrapers = {
+        'UPSC': _StaticScraper(_update('a')),
+        'GATE': _StaticScraper(_update('b', 'GATE')),
+    }
+    
+    def log_scraping_attempts(attempts):
+        raise RuntimeError('disk full')
+    
+    working_log_scraping_attempts = server.storage.log_scraping_attempts
+    monkeypatch.setattr(server.storage, 'log_scraping_attempts', log_scraping_attempts)
+    result = server.scrape_all_websites()
+    
+    assert result['new_updates_count'] == 0
+    assert {stats['status'] for stats in result['scraping_stats'].values()} == {'error'}
+    conn = server.storage.connection()
+    assert conn.execute('SELECT COUNT(*) FROM updates').fetchone()[0] == 0
+    assert conn.execute('SELECT COUNT(*) FROM scraping_log').fetchone()[0] == 0
+    assert list(tmp_path.glob('data/backups/updates_*.json')) == []
+    
+    # Nothing was remembered as stored, so the next cycle saves the updates and backs them up once
+    monkeypatch.setattr(server.storage, 'log_scraping_attempts', working_log_scraping_attempts)
+    assert server.scrape_all_websites()['new_updates_count'] == 2
+    assert len(list(tmp_path.glob('data/backups/updates_*.json'))) == 1
+
+
+def test_failed_scrape_is_recorded_as_an_error(server):
+    class _FailingScraper:
+        def scrape(self):
+            raise ConnectionError('site down')
+    
+    server.scrapers = {'UPSC': _FailingScraper(), 'GATE': _StaticScraper(_update('b', 'GATE'))}
+    
+    stats = server.scrape_all_websites()['scraping_stats']
+    
+    assert stats['UPSC'] == {'status': 'error', 'updates_found': 0, 'duration': stats['UPSC']['duration'], 'error': 'site down'}
+    assert stats['GATE']['status'] == 'success'
+    assert stats['GATE']['updates_found'] == 1
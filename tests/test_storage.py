@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from data import storage as storage_module
+from data.storage import DataStorage
+from utils.helpers import read_json
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_module, 'JSON_BACKUP_PATH', str(tmp_path / 'backups'))
+    instance = DataStorage(str(tmp_path / 'db' / 'test.db'))
+    yield instance
+    instance.close_connections()
+
+
+def _update(content_hash):
+    return {'title': f'Notice {content_hash}', 'source': 'UPSC', 'scraped_at': '2026-10-16T10:00:00',
+            'content_hash': content_hash}
+
+
+def _committed_count(storage, table):
+    # A separate connection only sees committed rows
+    conn = sqlite3.connect(storage.db_path)
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _backups(tmp_path):
+    backup_dir = tmp_path / 'backups'
+    return sorted(backup_dir.iterdir()) if backup_dir.exists() else []
+
+
+def test_bulk_commit_defers_commit_and_backup(storage, tmp_path):
+    with storage.bulk_commit():
+        assert len(storage.save_updates([_update('a'), _update('b')])) == 2
+        storage.log_scraping_attempts([('UPSC', 'success', 2, None, 0.5)])
+        
+        # Neither the rows nor the backup exist until the transaction commits
+        assert _committed_count(storage, 'updates') == 0
+        assert _committed_count(storage, 'scraping_log') == 0
+        assert _backups(tmp_path) == []
+    
+    assert _committed_count(storage, 'updates') == 2
+    assert _committed_count(storage, 'scraping_log') == 1
+    [backup] = _backups(tmp_path)
+    assert [update['content_hash'] for update in read_json(str(backup))] == ['a', 'b']
+
+
+def test_bulk_commit_failure_rolls_back_without_backup(storage, tmp_path):
+    with pytest.raises(RuntimeError):
+        with storage.bulk_commit():
+            storage.save_updates([_update('a')])
+            storage.log_scraping_attempts([('UPSC', 'success', 1, None, 0.5)])
+            raise RuntimeError('log write failed')
+    
+    assert _committed_count(storage, 'updates') == 0
+    assert _committed_count(storage, 'scraping_log') == 0
+    assert _backups(tmp_path) == []
+    
+    # The rolled back update is new again on the next save
+    assert len(storage.save_updates([_update('a')])) == 1
+
+
+def test_save_outside_bulk_commits_immediately(storage, tmp_path):
+    storage.save_updates([_update('a')])
+    
+    assert _committed_count(storage, 'updates') == 1
+    assert len(_backups(tmp_path)) == 1
+
+
+def test_connection_rolls_back_a_leftover_transaction(storage):
+    conn = storage.connection()
+    conn.execute(
+        "INSERT INTO updates (title, source, exam_type, scraped_at, content_hash) VALUES ('t', 'UPSC', 'UPSC', 'now', 'x')"
+    )
+    assert conn.in_transaction
+    
+    # A call that failed before committing must not leak its writes into the next one
+    assert storage.connection() is conn
+    assert not conn.in_transaction
+    storage.log_scraping_attempts([('UPSC', 'success', 0, None, 0.1)])
+    assert _committed_count(storage, 'updates') == 0
+    assert _committed_count(storage, 'scraping_log') == 1
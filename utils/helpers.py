@@ -1,8 +1,17 @@
 import re
+import os
+import json
+import stat
+import tempfile
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
@@ -146,6 +155,45 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def load_json(payload) -> Any:
+    """Parse a JSON str or bytes payload, using orjson when it is installed"""
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def read_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        return load_json(f.read())
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Serialize data up front, write it in one call and rename it over path"""
+    payload = dump_json_bytes(data)
+    # A unique temp file per call, so concurrent writers of the same path never share one
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        # Binary mode skips the TextIOWrapper encoding layer
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        # mkstemp creates the file owner-only; keep the permissions of the file being replaced
+        if os.path.exists(path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     """Merge two dictionaries, with dict2 taking precedence"""
     result = dict1.copy()